@@ -10,19 +10,35 @@ import asyncio
 import csv
 import logging
 import os
-import pandas as pd
+import re
+import threading
+from functools import partial
 from datetime import datetime
-from typing import List, Tuple, Optional, Dict, Any
-import gradio as gr
+from typing import TYPE_CHECKING, Callable, List, Tuple, Optional, Dict, Any
 
 # Import our enhanced scraping system
-from src.scrapers import ISPScraper, YellowPagesScraper, GoogleBusinessScraper
-from src.processors.csv_generator import CSVGenerator
-from src.processors.data_validator import DataValidator
-from src.processors.industry_classifier import IndustryClassifier
+from src.scrapers import ISPScraper, YellowPagesScraper, GoogleBusinessScraper, create_session
+
+# pandas, numpy and the processors built on them are imported where they are first
+# used, so the UI starts without loading them; they load on the first lead generation run
+if TYPE_CHECKING:
+    import pandas as pd
 
 # Import configuration manager
 from src.utils.config_manager import config_manager
+from src.utils.ollama_status import invalidate_ollama_cache
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
 
 # Setup logging
 logging.basicConfig(
@@ -31,14 +47,55 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Keywords that route a search query to ISP-specific lead generation
+ISP_QUERY_KEYWORDS = (
+    'isp', 'wisp', 'internet service provider', 'internet provider', 'broadband',
+    'telecommunications', 'telecom', 'fiber', 'cable internet', 'wireless internet'
+)
+# Whole words only (so 'crisp' doesn't match), allowing a plural 's' ('ISPs', 'internet service providers')
+_ISP_QUERY_RE = re.compile(
+    r'\b(?:' + '|'.join(map(re.escape, sorted(ISP_QUERY_KEYWORDS, key=len, reverse=True))) + r')s?\b',
+    re.IGNORECASE
+)
+
+def _build_keyword_automaton(keywords):
+    """Build an Aho-Corasick automaton mapping each keyword to its length."""
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, len(keyword))
+    automaton.make_automaton()
+    return automaton
+
+# Single-pass keyword scan, independent of keyword count, when pyahocorasick is installed
+_ISP_QUERY_AUTOMATON = _build_keyword_automaton(ISP_QUERY_KEYWORDS) if AHOCORASICK_AVAILABLE else None
+
+def _is_word_char(text: str, index: int) -> bool:
+    """Check whether the character at index is a regex word character."""
+    return 0 <= index < len(text) and (text[index].isalnum() or text[index] == '_')
+
+def _no_progress(*args, **kwargs):
+    """Progress callback used when no tracker is supplied."""
+
+# Filename slug normalization applied to queries and locations
+_SLUG_TABLE = str.maketrans({' ': '_', '/': '_', ',': ''})
+
+# Upper bound for an API connection test so a hung handshake cannot pin a Gradio worker
+API_TEST_TIMEOUT = 10
+
 class EnhancedCRMApp:
     """Enhanced CRM application with comprehensive lead generation and contact extraction."""
     
     def __init__(self):
         """Initialize all components."""
-        self.isp_scraper = ISPScraper(rate_limit_delay=2.0)
-        self.yp_scraper = YellowPagesScraper(rate_limit_delay=2.5)
-        self.google_scraper = GoogleBusinessScraper(rate_limit_delay=3.0)
+        # Scrapers share one pooled session so keep-alive connections are reused
+        self.http_session = create_session()
+        self.isp_scraper = ISPScraper(rate_limit_delay=2.0, session=self.http_session)
+        self.yp_scraper = YellowPagesScraper(rate_limit_delay=2.5, session=self.http_session)
+        self.google_scraper = GoogleBusinessScraper(rate_limit_delay=3.0, session=self.http_session)
+        
+        from src.processors.csv_generator import CSVGenerator
+        from src.processors.data_validator import DataValidator
+        from src.processors.industry_classifier import IndustryClassifier
         self.csv_generator = CSVGenerator()
         self.data_validator = DataValidator()
         self.industry_classifier = IndustryClassifier()
@@ -55,7 +112,7 @@ class EnhancedCRMApp:
         industry: str,
         max_results: int,
         sources: List[str],
-        progress=gr.Progress()
+        progress: Optional[Callable[..., Any]] = None
     ) -> Tuple[str, str, str]:
         """
         Generate leads with enhanced web crawling and contact extraction.
@@ -66,11 +123,14 @@ class EnhancedCRMApp:
             industry: Industry filter
             max_results: Maximum number of results
             sources: Data sources to use
-            progress: Progress tracking
+            progress: Progress tracking callback (e.g. gr.Progress)
             
         Returns:
             Tuple of (status_message, csv_file_path, summary_report)
         """
+        if progress is None:
+            progress = _no_progress
+        
         try:
             progress(0.1, desc="Validating inputs and initializing...")
             
@@ -102,23 +162,9 @@ class EnhancedCRMApp:
                 )
                 all_results.extend(business_results)
             
-            progress(0.8, desc="Validating and enhancing data quality...")
-            
-            # Validate and enhance all results
-            validated_results = []
-            for result in all_results:
-                validated_result = self.data_validator.validate_and_enhance(result)
-                if validated_result['data_quality_score'] >= 5:  # Minimum quality threshold
-                    validated_results.append(validated_result)
-            
-            progress(0.9, desc="Generating CSV output and summary...")
-            
-            # Generate CSV file
-            csv_file_path = self._generate_csv_output(validated_results, search_query, location)
-            
-            # Generate summary report
-            summary_report = self._generate_summary_report(
-                validated_results, search_query, location, is_isp_search
+            # Validation, CSV and summary are CPU/disk bound; keep them off the shared event loop
+            validated_results, csv_file_path, summary_report = await asyncio.to_thread(
+                self._finalize_results, all_results, search_query, location, is_isp_search, progress
             )
             
             status_message = f"✅ Generated {len(validated_results)} high-quality leads for '{search_query}' in {location}"
@@ -130,22 +176,64 @@ class EnhancedCRMApp:
             logger.error(f"Error generating leads: {e}")
             return f"❌ Error: {str(e)}", "", ""
     
+    def _finalize_results(
+        self,
+        all_results: List[Dict[str, Any]],
+        search_query: str,
+        location: str,
+        is_isp_search: bool,
+        progress
+    ) -> Tuple[List[Dict[str, Any]], str, str]:
+        """Validate the scraped results, then write the CSV and summary report."""
+        import pandas as pd
+        
+        progress(0.8, desc="Validating and enhancing data quality...")
+        
+        # Validate and enhance all results in one batch
+        validated_df = self.data_validator.validate_and_enhance_batch(
+            pd.DataFrame(all_results, dtype=object)
+        )
+        validated_df = validated_df[validated_df['data_quality_score'] >= 5]  # Minimum quality threshold
+        validated_results = validated_df.to_dict('records')
+        
+        progress(0.9, desc="Generating CSV output and summary...")
+        
+        # Generate CSV file
+        csv_file_path = self._generate_csv_output(validated_results, search_query, location)
+        
+        # Generate summary report
+        summary_report = self._generate_summary_report(
+            validated_results, search_query, location, is_isp_search
+        )
+        
+        return validated_results, csv_file_path, summary_report
+    
     def _is_isp_related_query(self, query: str) -> bool:
         """Check if query is ISP-related."""
-        isp_keywords = [
-            'isp', 'internet service provider', 'internet provider', 'broadband',
-            'telecommunications', 'telecom', 'fiber', 'cable internet', 'wireless internet'
-        ]
-        query_lower = query.lower()
-        return any(keyword in query_lower for keyword in isp_keywords)
+        if _ISP_QUERY_AUTOMATON is None:
+            return bool(_ISP_QUERY_RE.search(query))
+        
+        # Same whole-word semantics as _ISP_QUERY_RE, including the optional plural 's'
+        text = query.lower()
+        for end, length in _ISP_QUERY_AUTOMATON.iter(text):
+            after = end + 1
+            if after < len(text) and text[after] == 's':
+                after += 1
+            if not _is_word_char(text, end - length) and not _is_word_char(text, after):
+                return True
+        return False
     
     async def _generate_isp_leads(self, location: str, max_results: int, progress) -> List[Dict[str, Any]]:
         """Generate ISP leads with enhanced contact extraction."""
+        import pandas as pd
+        
         logger.info(f"Generating ISP leads for {location} with enhanced web crawling")
         
         try:
-            # Use ISP scraper which includes contact enhancement
-            isp_results = self.isp_scraper.scrape(
+            # Use ISP scraper which includes contact enhancement; the crawl blocks,
+            # so it runs in a worker thread to keep other requests moving on the shared loop
+            isp_results = await asyncio.to_thread(
+                self.isp_scraper.scrape,
                 query="internet service provider",
                 location=location,
                 max_results=max_results
@@ -154,12 +242,11 @@ class EnhancedCRMApp:
             progress(0.6, desc=f"Found {len(isp_results)} ISPs, enhancing with detailed contact information...")
             
             # Additional enhancement for ISP-specific data
-            enhanced_results = []
-            for isp in isp_results:
-                enhanced_isp = self._enhance_isp_data(isp)
-                enhanced_results.append(enhanced_isp)
+            enhanced_df = await asyncio.to_thread(
+                self._enhance_isp_data, pd.DataFrame(isp_results, dtype=object)
+            )
             
-            return enhanced_results
+            return enhanced_df.to_dict('records')
             
         except Exception as e:
             logger.error(f"Error generating ISP leads: {e}")
@@ -179,33 +266,68 @@ class EnhancedCRMApp:
         all_results = []
         
         try:
-            # Use Yellow Pages scraper with enhanced contact extraction
+            # Run the enabled directory scrapers concurrently; they are blocking,
+            # so each one gets its own worker thread
+            scrapers = []
             if 'Yellow Pages' in sources or not sources:
-                progress(0.4, desc="Scraping Yellow Pages with deep web crawling...")
-                yp_results = self.yp_scraper.scrape(
-                    query=query,
-                    location=location,
-                    max_results=max_results // 2
-                )
-                all_results.extend(yp_results)
+                scrapers.append(('Yellow Pages', self.yp_scraper))
+            if 'Google Business' in sources:
+                scrapers.append(('Google Business', self.google_scraper))
+            
+            progress(0.4, desc="Scraping business directories with deep web crawling...")
+            source_results = await asyncio.gather(
+                *(
+                    asyncio.to_thread(
+                        scraper.scrape,
+                        query=query,
+                        location=location,
+                        max_results=max_results // 2
+                    )
+                    for _, scraper in scrapers
+                ),
+                return_exceptions=True
+            )
             
-            # Future: Add other sources
-            progress(0.6, desc="Classifying industries and enhancing contact information...")
+            for (name, _), results in zip(scrapers, source_results):
+                if isinstance(results, Exception):
+                    logger.error(f"Error scraping {name}: {results}")
+                    continue
+                all_results.extend(results or [])
             
-            # Classify industries for all results
-            for business in all_results:
-                industry_info = self.industry_classifier.classify(business)
-                business.update(industry_info)
+            progress(0.6, desc="Classifying industries and enhancing contact information...")
             
-            return all_results[:max_results]
+            classified = await asyncio.to_thread(self._classify_businesses, all_results)
+            return classified[:max_results]
             
         except Exception as e:
             logger.error(f"Error generating business leads: {e}")
             return []
     
-    def _enhance_isp_data(self, isp_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _classify_businesses(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Deduplicate directory listings and classify their industries in one batch."""
+        import pandas as pd
+        
+        # Drop listings returned by more than one source before further processing
+        businesses_df = pd.DataFrame(results, dtype=object)
+        dedup_keys = [key for key in ('business_name', 'phone_number') if key in businesses_df.columns]
+        if dedup_keys:
+            businesses_df = businesses_df.drop_duplicates(subset=dedup_keys, keep='first')
+        
+        # Classify industries for all results in one batch
+        classification = self.industry_classifier.classify_batch(businesses_df)
+        for column, values in classification.items():
+            if column in businesses_df.columns:
+                values = values.combine_first(businesses_df[column])
+            businesses_df[column] = values
+        
+        return businesses_df.to_dict('records')
+    
+    def _enhance_isp_data(self, isp_df: 'pd.DataFrame') -> 'pd.DataFrame':
         """Add ISP-specific enhancements."""
-        enhanced = isp_data.copy()
+        import numpy as np
+        import pandas as pd
+        
+        enhanced = isp_df.copy()
         
         # Add ISP-specific fields
         enhanced['industry'] = 'Internet Service Provider'
@@ -213,25 +335,30 @@ class EnhancedCRMApp:
         enhanced['industry_category'] = 'Telecommunications'
         
         # Determine ISP type based on services
-        service_type = enhanced.get('service_type', '')
-        if 'fiber' in service_type.lower():
-            enhanced['technology_focus'] = 'Fiber Optic'
-        elif 'cable' in service_type.lower():
-            enhanced['technology_focus'] = 'Cable Broadband'
-        elif 'satellite' in service_type.lower():
-            enhanced['technology_focus'] = 'Satellite Internet'
-        elif 'wireless' in service_type.lower():
-            enhanced['technology_focus'] = 'Wireless/5G'
+        if 'service_type' in enhanced.columns:
+            service_type = enhanced['service_type'].fillna('').astype(str).str.lower()
         else:
-            enhanced['technology_focus'] = 'Mixed Services'
+            service_type = pd.Series('', index=enhanced.index)
+        enhanced['technology_focus'] = np.select(
+            [
+                service_type.str.contains('fiber', regex=False),
+                service_type.str.contains('cable', regex=False),
+                service_type.str.contains('satellite', regex=False),
+                service_type.str.contains('wireless', regex=False)
+            ],
+            ['Fiber Optic', 'Cable Broadband', 'Satellite Internet', 'Wireless/5G'],
+            default='Mixed Services'
+        )
         
         return enhanced
     
     def _generate_csv_output(self, results: List[Dict[str, Any]], query: str, location: str) -> str:
         """Generate CSV file with enhanced CRM fields."""
+        import pandas as pd
+        
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        query_slug = query.lower().replace(' ', '_').replace('/', '_')
-        location_slug = location.lower().replace(' ', '_').replace(',', '')
+        query_slug = query.lower().translate(_SLUG_TABLE)
+        location_slug = location.lower().translate(_SLUG_TABLE)
         
         filename = f"enhanced_leads_{query_slug}_{location_slug}_{timestamp}.csv"
         filepath = os.path.join('data', 'outputs', filename)
@@ -260,21 +387,17 @@ class EnhancedCRMApp:
         ]
         
         try:
-            with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                
-                for result in results:
-                    # Ensure all fields exist
-                    row = {}
-                    for field in fieldnames:
-                        row[field] = result.get(field, 'NOT_FOUND')
-                    
-                    # Add metadata
-                    row['last_updated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    row['verification_status'] = 'auto_extracted'
-                    
-                    writer.writerow(row)
+            # Select only the CRM columns up front; explicit object dtype skips
+            # per-column type inference and keeps integers from becoming floats
+            df = pd.DataFrame(results, columns=fieldnames, dtype=object)
+            df = df.fillna('NOT_FOUND')
+            
+            # Add metadata
+            df['last_updated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            df['verification_status'] = 'auto_extracted'
+            
+            # Flush rows to disk in chunks to keep memory flat on large result sets
+            df.to_csv(filepath, index=False, encoding='utf-8', chunksize=5000)
             
             logger.info(f"Generated CSV file: {filepath}")
             return filepath
@@ -291,19 +414,28 @@ class EnhancedCRMApp:
         is_isp_search: bool
     ) -> str:
         """Generate comprehensive summary report."""
-        total_leads = len(results)
-        high_quality_leads = len([r for r in results if r.get('data_quality_score', 0) >= 8])
+        import pandas as pd
+        
+        df = pd.DataFrame(results, columns=[
+            'data_quality_score', 'ceo_name', 'ceo_email', 'website',
+            'industry', 'technology_focus'
+        ], dtype=object)
+        
+        # Low-cardinality columns are aggregated per category rather than per row
+        industry = df['industry'].fillna('Unknown').astype('category')
+        technology_focus = df['technology_focus'].astype('category')
+        
+        total_leads = len(df)
+        high_quality_leads = int((pd.to_numeric(df['data_quality_score'], errors='coerce') >= 8).sum())
         
         # Calculate contact information completeness
-        with_ceo = len([r for r in results if r.get('ceo_name') and r.get('ceo_name') != 'NOT_FOUND'])
-        with_email = len([r for r in results if r.get('ceo_email') and r.get('ceo_email') != 'NOT_FOUND'])
-        with_website = len([r for r in results if r.get('website') and r.get('website') != 'NOT_FOUND'])
+        with_ceo = self._count_found(df['ceo_name'])
+        with_email = self._count_found(df['ceo_email'])
+        with_website = self._count_found(df['website'])
         
         # Industry breakdown
-        industries = {}
-        for result in results:
-            industry = result.get('industry', 'Unknown')
-            industries[industry] = industries.get(industry, 0) + 1
+        industry_counts = industry.value_counts()
+        industries = industry_counts[industry_counts > 0].to_dict()
         
         summary = f"""
 ## Enhanced CRM Lead Generation Results
@@ -328,8 +460,8 @@ class EnhancedCRMApp:
         
         if is_isp_search:
             # ISP-specific metrics
-            fiber_providers = len([r for r in results if 'fiber' in r.get('technology_focus', '').lower()])
-            cable_providers = len([r for r in results if 'cable' in r.get('technology_focus', '').lower()])
+            fiber_providers = int(technology_focus.str.contains('fiber', case=False, na=False).sum())
+            cable_providers = int(technology_focus.str.contains('cable', case=False, na=False).sum())
             
             summary += f"""
 ### ISP Technology Analysis
@@ -355,36 +487,80 @@ class EnhancedCRMApp:
 """
         
         return summary
+    
+    @staticmethod
+    def _count_found(column: 'pd.Series') -> int:
+        """Count populated values in a column, ignoring NOT_FOUND placeholders."""
+        return int((column.notna() & (column != '') & (column != 'NOT_FOUND')).sum())
+
+
+_app: Optional[EnhancedCRMApp] = None
+_app_lock = threading.Lock()
+_event_loop: Optional[asyncio.AbstractEventLoop] = None
+_event_loop_lock = threading.Lock()
+
+
+def get_app() -> EnhancedCRMApp:
+    """Return the shared application instance, creating it on first use."""
+    global _app
+    with _app_lock:
+        if _app is None:
+            _app = EnhancedCRMApp()
+    return _app
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """Return the long-lived background event loop, starting it on first use."""
+    global _event_loop
+    with _event_loop_lock:
+        if _event_loop is None:
+            _event_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_event_loop.run_forever,
+                name="crm-event-loop",
+                daemon=True
+            ).start()
+    return _event_loop
 
 
 def generate_leads_wrapper(*args):
     """Wrapper function to run async lead generation."""
-    return asyncio.run(EnhancedCRMApp().generate_leads_async(*args))
+    future = asyncio.run_coroutine_threadsafe(
+        get_app().generate_leads_async(*args), get_event_loop()
+    )
+    return future.result()
 
 
 def view_csv_preview(csv_file_path: str):
     """Generate a preview of the CSV file."""
+    import pandas as pd
+    
     if not csv_file_path or not os.path.exists(csv_file_path):
         return "No CSV file available to preview."
     
     try:
-        df = pd.read_csv(csv_file_path)
+        # Only the header and the first 5 rows of the key fields are parsed into frames;
+        # records are counted with csv.reader so quoted fields spanning lines count once
+        key_fields = ['business_name', 'ceo_name', 'phone_number', 'website', 'data_quality_score']
+        columns = pd.read_csv(csv_file_path, nrows=0).columns
+        
+        with open(csv_file_path, 'r', encoding='utf-8', newline='') as f:
+            total_records = max(0, sum(1 for _ in csv.reader(f)) - 1)
         
         # Show basic stats
         preview = f"""
 ## CSV File Preview: {os.path.basename(csv_file_path)}
 
-**Total Records:** {len(df)}
-**Columns:** {len(df.columns)}
+**Total Records:** {total_records}
+**Columns:** {len(columns)}
 
 ### Sample Records (First 5):
 """
         
         # Show first 5 records with key fields
-        key_fields = ['business_name', 'ceo_name', 'phone_number', 'website', 'data_quality_score']
-        display_fields = [field for field in key_fields if field in df.columns]
+        display_fields = [field for field in key_fields if field in columns]
         
-        sample_df = df[display_fields].head()
+        sample_df = pd.read_csv(csv_file_path, usecols=display_fields, nrows=5)[display_fields]
         preview += sample_df.to_string(index=False)
         
         return preview
@@ -445,21 +621,27 @@ def update_anthropic_key(api_key: str):
         error_msg = "\n".join(result['errors'])
         return f"❌ {error_msg}", get_api_status_display()
 
-def test_api_connection(provider: str):
-    """Test API connection."""
+async def test_api_connection(provider: str):
+    """Test API connection over the shared HTTP session."""
     try:
-        result = config_manager.test_api_connection(provider)
+        result = await asyncio.wait_for(
+            config_manager.test_api_connection_async(provider),
+            timeout=API_TEST_TIMEOUT
+        )
         
         if result['success']:
             return f"✅ {result['message']} (Response time: {result['response_time']:.2f}s)"
         else:
             return f"❌ {result['message']}"
+    except asyncio.TimeoutError:
+        return f"❌ {provider.title()} API test timed out after {API_TEST_TIMEOUT}s"
     except Exception as e:
         return f"❌ Error testing {provider} connection: {str(e)}"
 
 def toggle_local_llm(enabled: bool):
     """Toggle local LLM on/off."""
     result = config_manager.update_local_llm_config(enabled=enabled)
+    invalidate_ollama_cache()
     
     if result['success']:
         success_msg = "\n".join(result['updates'])
@@ -489,6 +671,8 @@ def reset_configuration():
 
 def create_interface():
     """Create the enhanced Gradio interface with configuration management."""
+    # Gradio is only needed for the UI; importing it here keeps non-UI imports fast
+    import gradio as gr
     
     with gr.Blocks(
         title="Enhanced CRM Lead Generator",
@@ -716,43 +900,17 @@ def create_interface():
         )
         
         # Event handlers for configuration tab
-        openai_update_btn.click(
-            fn=update_openai_key,
-            inputs=[openai_key_input],
-            outputs=[openai_status, api_status_display]
-        )
-        
-        anthropic_update_btn.click(
-            fn=update_anthropic_key,
-            inputs=[anthropic_key_input],
-            outputs=[anthropic_status, api_status_display]
-        )
-        
-        openai_test_btn.click(
-            fn=lambda: test_api_connection("openai"),
-            outputs=[openai_status]
-        )
-        
-        anthropic_test_btn.click(
-            fn=lambda: test_api_connection("anthropic"),
-            outputs=[anthropic_status]
-        )
-        
-        local_llm_enabled.change(
-            fn=toggle_local_llm,
-            inputs=[local_llm_enabled],
-            outputs=[local_llm_status, api_status_display]
-        )
-        
-        save_config_btn.click(
-            fn=save_configuration,
-            outputs=[config_result]
-        )
-        
-        reset_config_btn.click(
-            fn=reset_configuration,
-            outputs=[config_result, api_status_display]
-        )
+        config_handlers = [
+            (openai_update_btn, 'click', update_openai_key, [openai_key_input], [openai_status, api_status_display]),
+            (anthropic_update_btn, 'click', update_anthropic_key, [anthropic_key_input], [anthropic_status, api_status_display]),
+            (openai_test_btn, 'click', partial(test_api_connection, "openai"), None, [openai_status]),
+            (anthropic_test_btn, 'click', partial(test_api_connection, "anthropic"), None, [anthropic_status]),
+            (local_llm_enabled, 'change', toggle_local_llm, [local_llm_enabled], [local_llm_status, api_status_display]),
+            (save_config_btn, 'click', save_configuration, None, [config_result]),
+            (reset_config_btn, 'click', reset_configuration, None, [config_result, api_status_display]),
+        ]
+        for component, event, handler, inputs, outputs in config_handlers:
+            getattr(component, event)(fn=handler, inputs=inputs, outputs=outputs)
         
         # Footer
         gr.HTML("""
@@ -767,12 +925,18 @@ def create_interface():
 
 def main():
     """Launch the enhanced CRM application."""
+    if UVLOOP_AVAILABLE:
+        uvloop.install()
+    
+    debug = os.getenv('CRM_DEBUG', '').lower() in ('1', 'true', 'yes')
+    
     interface = create_interface()
     interface.launch(
         server_name="0.0.0.0",
         server_port=7861,
         share=False,
-        debug=True
+        debug=debug,
+        max_threads=40
     )
 
 
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Build a native pre-flight launcher with Nuitka.
+
+Compiles scripts/run.py (version, dependency, directory and Ollama checks)
+to a native executable. The application itself (main.py, src/, Gradio) is
+not compiled: the launcher imports it from the installed environment after
+pre-flight, exactly as the interpreted run script does.
+
+Usage:
+    pip install nuitka
+    python scripts/build_launcher.py
+    ./scripts/crm-run
+"""
+
+import sys
+import logging
+import subprocess
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+LAUNCHER_NAME = "crm-run"
+
+# Only the launcher's own modules are compiled; everything else stays interpreted
+NO_FOLLOW = ['main', 'src', 'gradio', 'pandas', 'numpy', 'aiohttp']
+
+
+def setup_logging():
+    """Setup basic logging for the build script."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+    return logging.getLogger(__name__)
+
+
+def build_command():
+    """Assemble the Nuitka command line."""
+    # Accelerated (non-standalone) mode links against the current interpreter, so the
+    # launcher keeps using the installed site-packages for the app and its dependencies.
+    # Output lands in scripts/ so run.py still resolves the project root from __file__.
+    return [
+        sys.executable, '-m', 'nuitka',
+        '--lto=yes',
+        '--remove-output',
+        f'--output-dir={SCRIPTS_DIR}',
+        f'--output-filename={LAUNCHER_NAME}',
+        *[f'--nofollow-import-to={module}' for module in NO_FOLLOW],
+        str(SCRIPTS_DIR / 'run.py'),
+    ]
+
+
+def main():
+    """Build the launcher."""
+    logger = setup_logging()
+
+    try:
+        import nuitka  # noqa: F401
+    except ImportError:
+        logger.error("❌ Nuitka is not installed. Run: pip install nuitka")
+        sys.exit(1)
+
+    command = build_command()
+    logger.info(f"Building launcher: {' '.join(command)}")
+
+    result = subprocess.run(command)
+    if result.returncode != 0:
+        logger.error(f"❌ Nuitka build failed with exit code {result.returncode}")
+        sys.exit(result.returncode)
+
+    logger.info(f"✅ Launcher built: {SCRIPTS_DIR / LAUNCHER_NAME}")
+
+
+if __name__ == "__main__":
+    main()
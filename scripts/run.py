@@ -8,9 +8,22 @@ with comprehensive error handling and helpful guidance.
 
 import sys
 import os
-import subprocess
+import asyncio
 import logging
+from functools import cache
+from http.client import HTTPException
 from pathlib import Path
+from importlib.metadata import distributions
+from urllib.error import URLError
+from urllib.request import urlopen
+
+# Make the project root importable before pre-flight so src.* and main resolve early
+_PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+# Runtime directories created during pre-flight
+_DIRS = ('data/outputs', 'data/cache', 'logs')
 
 def setup_logging():
     """Setup basic logging for the run script."""
@@ -20,6 +33,7 @@ def setup_logging():
     )
     return logging.getLogger(__name__)
 
+@cache
 def check_python_version():
     """Verify Python version compatibility."""
     if sys.version_info < (3, 9):
@@ -27,23 +41,26 @@ def check_python_version():
             f"Python 3.9+ required. Current version: {sys.version_info.major}.{sys.version_info.minor}"
         )
 
+# Needed to boot the interface; pandas is loaded on demand, but every lead generation run needs it
+CRITICAL_PACKAGES = ['gradio', 'pydantic', 'pyyaml', 'aiohttp', 'beautifulsoup4', 'pandas']
+
+@cache
+def _installed_distributions():
+    """Normalized names of installed distributions, read from metadata without importing them."""
+    return frozenset(
+        (dist.metadata['Name'] or '').lower().replace('-', '_')
+        for dist in distributions()
+    )
+
+def _missing(packages):
+    """Return the packages that are not installed."""
+    installed = _installed_distributions()
+    return [package for package in packages if package.replace('-', '_') not in installed]
+
+@cache
 def check_dependencies():
     """Check if required dependencies are installed."""
-    required_packages = [
-        'gradio',
-        'pydantic', 
-        'pyyaml',
-        'aiohttp',
-        'beautifulsoup4',
-        'pandas'
-    ]
-    
-    missing_packages = []
-    for package in required_packages:
-        try:
-            __import__(package.replace('-', '_'))
-        except ImportError:
-            missing_packages.append(package)
+    missing_packages = _missing(CRITICAL_PACKAGES)
     
     if missing_packages:
         raise RuntimeError(
@@ -51,49 +68,87 @@ def check_dependencies():
             "Please run: pip install -r requirements.txt"
         )
 
-def check_ollama_availability():
-    """Check if Ollama is available and running."""
+def _probe_ollama():
+    """Issue the single Ollama GET with the standard library."""
     try:
-        import requests
-        response = requests.get('http://localhost:11434/api/tags', timeout=5)
-        return response.status_code == 200
-    except Exception:
+        with urlopen('http://localhost:11434/api/tags', timeout=5) as response:
+            return response.status == 200
+    except (URLError, OSError, HTTPException, ValueError):
+        # Anything other than a healthy HTTP reply on the port means fallback processing
         return False
 
+async def check_ollama_availability():
+    """Check if Ollama is available and running, reusing a recent result if cached."""
+    from src.utils.ollama_status import read_cached_status, write_cached_status
+    
+    cached = read_cached_status()
+    if cached is not None:
+        return cached
+    
+    available = await asyncio.to_thread(_probe_ollama)
+    write_cached_status(available)
+    return available
+
+async def _preflight():
+    """Run the independent pre-flight checks concurrently."""
+    results = await asyncio.gather(
+        asyncio.to_thread(check_python_version),
+        asyncio.to_thread(check_dependencies),
+        asyncio.to_thread(create_directories),
+        asyncio.wait_for(check_ollama_availability(), timeout=5),
+        return_exceptions=True
+    )
+    
+    # Surface failures of the required checks in order so the RuntimeError/ImportError
+    # handlers still apply; an Ollama probe failure only means fallback processing
+    for outcome in results[:3]:
+        if isinstance(outcome, BaseException):
+            raise outcome
+    
+    ollama_available = results[3]
+    return ollama_available is True
+
 def create_directories():
     """Create necessary directories if they don't exist."""
-    directories = [
-        'data/outputs',
-        'data/cache', 
-        'logs'
-    ]
-    
-    for directory in directories:
-        Path(directory).mkdir(parents=True, exist_ok=True)
+    for directory in _DIRS:
+        # A stat is cheaper than mkdir on the usual warm start where everything exists
+        if not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
 
 def display_startup_info(logger, ollama_available):
     """Display helpful startup information."""
-    logger.info("🚀 Starting CRM Lead Generation AI Agent")
-    logger.info("=" * 50)
-    
-    logger.info(f"✅ Python version: {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}")
-    logger.info("✅ Dependencies: All required packages installed")
-    logger.info("✅ Directories: Created successfully")
+    lines = [
+        "🚀 Starting CRM Lead Generation AI Agent",
+        "=" * 50,
+        f"✅ Python version: {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
+        "✅ Dependencies: All required packages installed",
+        "✅ Directories: Created successfully",
+    ]
     
     if ollama_available:
-        logger.info("✅ Ollama: Available and running")
-        logger.info("   → Local LLM processing enabled")
+        lines += [
+            "✅ Ollama: Available and running",
+            "   → Local LLM processing enabled",
+        ]
     else:
-        logger.warning("⚠️  Ollama: Not available")
-        logger.warning("   → Will use fallback processing")
-        logger.warning("   → Install Ollama for better performance and privacy:")
-        logger.warning("   → https://ollama.ai")
+        lines += [
+            "⚠️  Ollama: Not available",
+            "   → Will use fallback processing",
+            "   → Install Ollama for better performance and privacy:",
+            "   → https://ollama.ai",
+        ]
+    
+    lines += [
+        "=" * 50,
+        "🌐 Application will be available at: http://localhost:7860",
+        "📖 Check README.md for complete documentation",
+        "🛟 For support, check logs/crm_agent.log",
+        "=" * 50,
+    ]
     
-    logger.info("=" * 50)
-    logger.info("🌐 Application will be available at: http://localhost:7860")
-    logger.info("📖 Check README.md for complete documentation")
-    logger.info("🛟 For support, check logs/crm_agent.log")
-    logger.info("=" * 50)
+    # Emit the banner as one record; raise it to WARNING when Ollama is missing
+    level = logging.INFO if ollama_available else logging.WARNING
+    logger.log(level, "\n".join(lines))
 
 def main():
     """Main run script entry point."""
@@ -103,12 +158,8 @@ def main():
         # Pre-flight checks
         logger.info("Performing pre-flight checks...")
         
-        check_python_version()
-        check_dependencies()
-        create_directories()
-        
-        # Check Ollama availability
-        ollama_available = check_ollama_availability()
+        # Version, dependency, directory and Ollama checks run concurrently
+        ollama_available = asyncio.run(_preflight())
         
         # Display startup information
         display_startup_info(logger, ollama_available)
@@ -116,12 +167,8 @@ def main():
         # Import and run the main application
         logger.info("Loading application...")
         
-        # Add the current directory to Python path
-        current_dir = Path(__file__).parent
-        sys.path.insert(0, str(current_dir))
-        
-        # Import and run the app
-        from app import main as app_main
+        # Import and run the app; Gradio is only loaded once create_interface() runs
+        from main import main as app_main
         app_main()
         
     except KeyboardInterrupt:
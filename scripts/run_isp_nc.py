@@ -8,16 +8,47 @@ operating in North Carolina, following the CRM lead generation system architectu
 
 import asyncio
 import csv
+import functools
+import hashlib
 import json
 import logging
 import os
 import re
 import requests
-import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from itertools import compress, repeat
+from pathlib import Path
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple, Union
 from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
+import numpy as np
+import pandas as pd
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
 
 # Setup logging
 logging.basicConfig(
@@ -26,47 +57,184 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Known NC providers used alongside live scraping (FCC/industry and local directory data)
+FALLBACK_ISPS_PATH = Path(__file__).resolve().parent.parent / 'data' / 'nc_isps.json'
+
+# Opt-in directory for parsed Yellow Pages result pages (one JSON file per URL per day);
+# meant for development runs, so the page cache is off unless this is set
+YP_CACHE_DIR_ENV = 'CRM_YP_CACHE_DIR'
+
+# Yellow Pages listing containers; everything else on a results page is skipped at parse time
+_YP_STRAINER = SoupStrainer('div', class_='result')
+
+# Basic US phone number pattern
+_PHONE_RE = re.compile(r'^\(?([0-9]{3})\)?[-. ]?([0-9]{3})[-. ]?([0-9]{4})$')
+
+# http(s) URL whose netloc is plain ASCII host/port characters; urlparse always yields scheme and netloc for these
+_SIMPLE_URL_RE = re.compile(r"^https?://[A-Za-z0-9\-._~%!$&'()*+,;=:@]+(?:[/?#]|$)")
+
+# Shared instances of repeated field values (service types, coverage areas, sources)
+_INTERN: Dict[str, str] = {}
+
+# Punctuation and separators ignored when comparing business names
+_NON_WORD_RE = re.compile(r'[^\w]+')
+
+# (tag, class) -> listing field, resolved in a single walk over each listing
+_YP_FIELD_TAGS = {
+    ('a', 'business-name'): 'name',
+    ('p', 'adr'): 'address',
+    ('div', 'phones'): 'phone',
+    ('a', 'track-visit-website'): 'website',
+    ('p', 'snippet'): 'description',
+}
+
+@functools.lru_cache(maxsize=4096)
+def _canonical_name(name: str) -> str:
+    """Lowercased, punctuation-free, token-sorted form of a business name."""
+    return ' '.join(sorted(_NON_WORD_RE.sub(' ', name.lower()).split()))
+
+def _intern(value: Any) -> Any:
+    """Return the shared instance of a repeated string value."""
+    return _INTERN.setdefault(value, value) if isinstance(value, str) else value
+
+@functools.lru_cache(maxsize=1)
+def _load_fallback_isps() -> pd.DataFrame:
+    """Load the bundled NC ISP reference list once per process."""
+    with open(FALLBACK_ISPS_PATH, 'r', encoding='utf-8') as f:
+        df = pd.DataFrame(json.load(f), dtype=object)
+    
+    # json.load creates a new str per occurrence; share the low-cardinality values
+    for column in ('address', 'service_type', 'coverage', 'source'):
+        if column in df:
+            df[column] = pd.Series([_intern(value) for value in df[column]], index=df.index, dtype=object)
+    return df
+
+def _fallback_isps(source: str) -> List[Dict[str, Any]]:
+    """Fresh record dicts for one source of the bundled ISP list."""
+    df = _load_fallback_isps()
+    return df[df['source'] == source].to_dict('records')
+
+def _join_flags(flags: Any) -> str:
+    """Render a validation flag list as a CSV cell."""
+    return '; '.join(flags) if isinstance(flags, list) else ''
+
+def _first_record(df: pd.DataFrame) -> Dict[str, Any]:
+    """First row of a batch result as a plain dict with Python scalars."""
+    return {field: value.item() if isinstance(value, np.generic) else value for field, value in df.iloc[0].items()}
+
+def _is_missing(value: Any) -> bool:
+    """True for None and NaN placeholders left by column alignment."""
+    return value is None or (isinstance(value, float) and value != value)
+
+def _text(df: pd.DataFrame, column: str) -> pd.Series:
+    """Column as strings with missing values as ''."""
+    if column not in df:
+        return pd.Series('', index=df.index, dtype=object)
+    return df[column].fillna('').astype(str)
+
+def _lower_text(df: pd.DataFrame, column: str) -> pd.Series:
+    """Column as lowercased strings with missing values as ''."""
+    return _text(df, column).str.lower()
+
+def _is_present(df: pd.DataFrame, column: str) -> np.ndarray:
+    """Truthiness of a column, treating missing values as absent."""
+    if column not in df:
+        return np.zeros(len(df), dtype=bool)
+    values = df[column]
+    return (values.notna() & values.astype(bool)).to_numpy(dtype=bool)
+
 class ISPScraper:
     """Web scraper specialized for finding ISP companies."""
     
-    def __init__(self):
+    def __init__(self, max_concurrency: int = 16, max_pages: int = 3,
+                 cache_dir: Optional[Union[str, Path]] = None):
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Connection': 'keep-alive'
         })
-        self.rate_limit_delay = 2.0  # seconds between requests
         
-    def _rate_limit(self):
-        """Implement rate limiting between requests."""
-        time.sleep(self.rate_limit_delay)
+        # Pooled adapter so the sync fallback reuses TLS connections and retries transient failures
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.rate_limit_delay = 2.0  # seconds between requests
+        self.max_concurrency = max_concurrency
+        self.max_pages = max_pages  # Yellow Pages result pages fetched per search
+        if cache_dir is None:
+            cache_dir = os.getenv(YP_CACHE_DIR_ENV) or None
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None  # None disables the page cache
+        
+        # Async fetch state is created lazily inside the running event loop
+        self._aio_session = None
+        self._sem: Optional[asyncio.BoundedSemaphore] = None
+        self._rate_lock: Optional[asyncio.Lock] = None
+        self._next_request_at: Dict[str, float] = {}
+    
+    async def _rate_limit_async(self, url: str):
+        """Space request start times per host by rate_limit_delay without blocking the event loop."""
+        host = urlparse(url).netloc
+        loop = asyncio.get_running_loop()
+        async with self._rate_lock:
+            now = loop.time()
+            next_at = self._next_request_at.get(host, now)
+            wait = next_at - now
+            self._next_request_at[host] = max(now, next_at) + self.rate_limit_delay
+        if wait > 0:
+            await asyncio.sleep(wait)
     
-    def scrape_yellow_pages_isp(self, location: str) -> List[Dict[str, Any]]:
-        """Scrape ISP listings from Yellow Pages."""
+    async def _fetch(self, url: str) -> Optional[str]:
+        """Fetch a page body, gated by the concurrency semaphore and rate limiter."""
+        if self._sem is None:
+            self._sem = asyncio.BoundedSemaphore(self.max_concurrency)
+            self._rate_lock = asyncio.Lock()
+        
+        async with self._sem:
+            await self._rate_limit_async(url)
+            
+            if not AIOHTTP_AVAILABLE:
+                response = await asyncio.to_thread(self.session.get, url, timeout=30)
+                return response.text if response.status_code == 200 else None
+            
+            if self._aio_session is None or self._aio_session.closed:
+                self._aio_session = aiohttp.ClientSession(headers=dict(self.session.headers))
+            async with self._aio_session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                if response.status != 200:
+                    return None
+                return await response.text()
+    
+    async def close(self):
+        """Close the async HTTP session and reset loop-bound state."""
+        if self._aio_session is not None and not self._aio_session.closed:
+            await self._aio_session.close()
+        self._aio_session = None
+        self._sem = None
+        self._rate_lock = None
+        self._next_request_at.clear()
+    
+    def _yp_search_url(self, location: str, page: int) -> str:
+        """Build the Yellow Pages ISP search URL for a result page."""
+        url = f"https://www.yellowpages.com/search?search_terms=internet+service+provider&geo_location_terms={location.replace(' ', '+')}"
+        return url if page == 1 else f"{url}&page={page}"
+    
+    async def scrape_yellow_pages_isp(self, location: str) -> List[Dict[str, Any]]:
+        """Scrape ISP listings from Yellow Pages, fetching result pages concurrently."""
         logger.info(f"Scraping Yellow Pages for ISPs in {location}")
         results = []
         
         try:
-            # Yellow Pages search URL for ISPs
-            search_url = f"https://www.yellowpages.com/search?search_terms=internet+service+provider&geo_location_terms={location.replace(' ', '+')}"
-            
-            self._rate_limit()
-            response = self.session.get(search_url, timeout=30)
+            urls = [self._yp_search_url(location, page) for page in range(1, self.max_pages + 1)]
+            pages = await asyncio.gather(*(self._fetch_yp_listings(url) for url in urls), return_exceptions=True)
             
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Find business listings
-                listings = soup.find_all('div', class_='result')
-                
-                for listing in listings[:20]:  # Limit to first 20 results
-                    try:
-                        business_data = self._extract_yp_business_data(listing)
-                        if business_data and 'internet' in business_data.get('business_description', '').lower():
-                            business_data['source'] = 'yellow_pages'
-                            results.append(business_data)
-                    except Exception as e:
-                        logger.warning(f"Error extracting business data: {e}")
-                        continue
+            for url, page in zip(urls, pages):
+                if isinstance(page, Exception):
+                    logger.warning(f"Error fetching {url}: {page}")
+                elif page:
+                    results.extend(page)
             
             logger.info(f"Found {len(results)} ISP listings from Yellow Pages")
             
@@ -75,27 +243,107 @@ class ISPScraper:
         
         return results
     
+    async def _fetch_yp_listings(self, url: str) -> List[Dict[str, Any]]:
+        """Parsed listings for one results page, served from today's disk cache when present."""
+        cached = self._read_page_cache(url)
+        if cached is not None:
+            return cached
+        
+        html = await self._fetch(url)
+        if not html:
+            return []
+        
+        listings = self._parse_yp_listings(html)
+        # An empty parse is usually a CAPTCHA or interstitial page, so it must not stick for the day
+        if listings:
+            self._write_page_cache(url, listings)
+        return listings
+    
+    def _page_cache_path(self, url: str) -> Path:
+        """Cache file for a URL; the date in the key expires entries daily."""
+        key = hashlib.sha1(f"{datetime.now():%Y-%m-%d}|{url}".encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{key}.json"
+    
+    def _read_page_cache(self, url: str) -> Optional[List[Dict[str, Any]]]:
+        """Read cached listings, or None if caching is disabled or the entry is missing."""
+        if self.cache_dir is None:
+            return None
+        try:
+            with open(self._page_cache_path(url), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def _write_page_cache(self, url: str, listings: List[Dict[str, Any]]):
+        """Atomically persist parsed listings for a URL."""
+        if self.cache_dir is None:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self._page_cache_path(url)
+            tmp_path = path.with_suffix('.json.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(listings, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug(f"Could not write Yellow Pages cache for {url}: {e}")
+    
+    def _parse_yp_listings(self, html: str) -> List[Dict[str, Any]]:
+        """Extract ISP listings from one Yellow Pages results page."""
+        results = []
+        # Only materialize the listing subtrees rather than the whole page
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=_YP_STRAINER)
+        
+        # Find business listings
+        listings = soup.find_all('div', class_='result')
+        
+        for listing in listings[:20]:  # Limit to first 20 results per page
+            try:
+                business_data = self._extract_yp_business_data(listing)
+                if business_data and 'internet' in business_data.get('business_description', '').lower():
+                    business_data['source'] = 'yellow_pages'
+                    results.append(business_data)
+            except Exception as e:
+                logger.warning(f"Error extracting business data: {e}")
+                continue
+        
+        return results
+    
+    def _find_listing_fields(self, listing) -> Dict[str, Any]:
+        """Locate the first element for each listing field in one pass over the subtree."""
+        fields = {}
+        for element in listing.find_all(True):
+            for css_class in element.get('class') or ():
+                field = _YP_FIELD_TAGS.get((element.name, css_class))
+                if field and field not in fields:
+                    fields[field] = element
+            if len(fields) == len(_YP_FIELD_TAGS):
+                break
+        return fields
+    
     def _extract_yp_business_data(self, listing) -> Optional[Dict[str, Any]]:
         """Extract business data from Yellow Pages listing."""
         try:
+            fields = self._find_listing_fields(listing)
+            
             # Extract business name
-            name_elem = listing.find('a', class_='business-name')
+            name_elem = fields.get('name')
             business_name = name_elem.get_text(strip=True) if name_elem else ''
             
             # Extract address
-            address_elem = listing.find('p', class_='adr')
+            address_elem = fields.get('address')
             address = address_elem.get_text(strip=True) if address_elem else ''
             
             # Extract phone
-            phone_elem = listing.find('div', class_='phones')
+            phone_elem = fields.get('phone')
             phone = phone_elem.get_text(strip=True) if phone_elem else ''
             
             # Extract website (if available)
-            website_elem = listing.find('a', class_='track-visit-website')
+            website_elem = fields.get('website')
             website = website_elem.get('href', '') if website_elem else ''
             
             # Extract description
-            desc_elem = listing.find('p', class_='snippet')
+            desc_elem = fields.get('description')
             description = desc_elem.get_text(strip=True) if desc_elem else ''
             
             if business_name:
@@ -114,105 +362,9 @@ class ISPScraper:
     def scrape_fcc_broadband_providers(self, state: str) -> List[Dict[str, Any]]:
         """Scrape FCC broadband provider data for a state."""
         logger.info(f"Searching FCC data for broadband providers in {state}")
-        results = []
         
         # Known major ISPs in North Carolina (as fallback data)
-        nc_isps = [
-            {
-                'business_name': 'Spectrum (Charter Communications)',
-                'address': 'Multiple locations across North Carolina',
-                'phone_number': '(855) 243-8892',
-                'website': 'https://www.spectrum.com',
-                'business_description': 'Cable internet, TV, and phone services throughout North Carolina',
-                'service_type': 'Cable',
-                'coverage': 'Statewide'
-            },
-            {
-                'business_name': 'AT&T Internet',
-                'address': 'Multiple locations across North Carolina',
-                'phone_number': '(800) 288-2020',
-                'website': 'https://www.att.com',
-                'business_description': 'DSL, fiber, and wireless internet services in North Carolina',
-                'service_type': 'DSL/Fiber',
-                'coverage': 'Statewide'
-            },
-            {
-                'business_name': 'CenturyLink (Lumen)',
-                'address': 'Multiple locations across North Carolina',
-                'phone_number': '(866) 642-0444',
-                'website': 'https://www.centurylink.com',
-                'business_description': 'DSL and fiber internet services across North Carolina',
-                'service_type': 'DSL/Fiber',
-                'coverage': 'Statewide'
-            },
-            {
-                'business_name': 'Brightspeed',
-                'address': 'Multiple locations across North Carolina',
-                'phone_number': '(833) 692-7773',
-                'website': 'https://www.brightspeed.com',
-                'business_description': 'Fiber and DSL internet services in North Carolina',
-                'service_type': 'Fiber/DSL',
-                'coverage': 'Select areas'
-            },
-            {
-                'business_name': 'Windstream',
-                'address': 'Multiple locations across North Carolina',
-                'phone_number': '(866) 445-8084',
-                'website': 'https://www.windstream.com',
-                'business_description': 'Internet and telecommunications services in rural and urban North Carolina',
-                'service_type': 'DSL/Fiber',
-                'coverage': 'Select areas'
-            },
-            {
-                'business_name': 'Viasat',
-                'address': 'Satellite coverage across North Carolina',
-                'phone_number': '(855) 810-1308',
-                'website': 'https://www.viasat.com',
-                'business_description': 'Satellite internet services covering all of North Carolina',
-                'service_type': 'Satellite',
-                'coverage': 'Statewide'
-            },
-            {
-                'business_name': 'HughesNet',
-                'address': 'Satellite coverage across North Carolina',
-                'phone_number': '(866) 347-3292',
-                'website': 'https://www.hughesnet.com',
-                'business_description': 'Satellite internet services available throughout North Carolina',
-                'service_type': 'Satellite',
-                'coverage': 'Statewide'
-            },
-            {
-                'business_name': 'Wilkes Communications',
-                'address': 'North Wilkesboro, NC',
-                'phone_number': '(336) 838-7000',
-                'website': 'https://www.wilkes.net',
-                'business_description': 'Local fiber and cable internet provider serving northwest North Carolina',
-                'service_type': 'Fiber/Cable',
-                'coverage': 'Northwest NC'
-            },
-            {
-                'business_name': 'SkyLine/SkyBest',
-                'address': 'West Jefferson, NC',
-                'phone_number': '(800) 759-2226',
-                'website': 'https://www.skybest.com',
-                'business_description': 'Local telecommunications and internet provider serving western North Carolina',
-                'service_type': 'Fiber/DSL',
-                'coverage': 'Western NC'
-            },
-            {
-                'business_name': 'Yadtel',
-                'address': 'Yadkinville, NC',
-                'phone_number': '(336) 679-2000',
-                'website': 'https://www.yadtel.net',
-                'business_description': 'Local telecommunications and internet provider serving Yadkin County and surrounding areas',
-                'service_type': 'Fiber/DSL',
-                'coverage': 'Yadkin County area'
-            }
-        ]
-        
-        for isp in nc_isps:
-            isp['source'] = 'fcc_broadband_data'
-            results.append(isp)
+        results = _fallback_isps('fcc_broadband_data')
         
         logger.info(f"Added {len(results)} known ISPs from FCC/industry data")
         return results
@@ -220,51 +372,9 @@ class ISPScraper:
     def scrape_local_isp_directories(self) -> List[Dict[str, Any]]:
         """Scrape local ISP directory sites for North Carolina providers."""
         logger.info("Searching local ISP directories for North Carolina providers")
-        results = []
         
         # Additional local/regional ISPs in North Carolina
-        local_isps = [
-            {
-                'business_name': 'Randolph Telephone',
-                'address': 'Asheboro, NC',
-                'phone_number': '(336) 625-5151',
-                'website': 'https://www.rtmc.net',
-                'business_description': 'Local telecommunications provider serving Randolph County with fiber and DSL',
-                'service_type': 'Fiber/DSL',
-                'coverage': 'Randolph County'
-            },
-            {
-                'business_name': 'Piedmont Rural Telephone',
-                'address': 'Pittsboro, NC',
-                'phone_number': '(919) 542-4444',
-                'website': 'https://www.prtc.net',
-                'business_description': 'Rural telecommunications cooperative providing internet and phone services',
-                'service_type': 'Fiber/DSL',
-                'coverage': 'Central NC rural areas'
-            },
-            {
-                'business_name': 'Cape Hatteras Electric Cooperative',
-                'address': 'Buxton, NC',
-                'phone_number': '(252) 995-5616',
-                'website': 'https://www.chec.coop',
-                'business_description': 'Electric cooperative also providing fiber internet to Outer Banks',
-                'service_type': 'Fiber',
-                'coverage': 'Outer Banks'
-            },
-            {
-                'business_name': 'Charlotte Metro Credit Union',
-                'address': 'Charlotte, NC',
-                'phone_number': '(704) 375-0183',
-                'website': 'https://www.charlottemetro.org',
-                'business_description': 'Credit union offering internet services to members in Charlotte area',
-                'service_type': 'Partnership/Reseller',
-                'coverage': 'Charlotte metro'
-            }
-        ]
-        
-        for isp in local_isps:
-            isp['source'] = 'local_directories'
-            results.append(isp)
+        results = _fallback_isps('local_directories')
         
         logger.info(f"Added {len(results)} local ISPs from directory data")
         return results
@@ -272,144 +382,214 @@ class ISPScraper:
 class ISPClassifier:
     """Classifier specialized for ISP industry categorization."""
     
+    TELECOM_TERMS = frozenset(['telecommunications', 'telecom'])
+    SERVICE_TERMS = frozenset(['fiber', 'cable', 'satellite', 'dsl'])
+    
+    # Checked in order; the first type with a matching term wins
+    ISP_TYPE_TERMS = (
+        ('Fiber', frozenset(['fiber', 'fibre'])),
+        ('Cable', frozenset(['cable', 'coax'])),
+        ('Satellite', frozenset(['satellite'])),
+        ('DSL', frozenset(['dsl', 'digital subscriber'])),
+        ('Wireless', frozenset(['wireless', 'radio'])),
+    )
+    
     def __init__(self):
         self.isp_keywords = [
             'internet service provider', 'isp', 'broadband', 'internet',
             'telecommunications', 'telecom', 'fiber', 'cable internet',
             'wireless internet', 'satellite internet', 'dsl', 'high-speed internet'
         ]
+        self._keyword_weights = {
+            keyword: 30 if keyword in ('internet service provider', 'isp')
+            else 20 if keyword in ('broadband', 'internet')
+            else 10
+            for keyword in self.isp_keywords
+        }
+        
+        # Every term either scorer looks for, one column per term in the hit matrix
+        self._terms = tuple(sorted(frozenset(self._keyword_weights).union(
+            self.TELECOM_TERMS, self.SERVICE_TERMS, *(terms for _, terms in self.ISP_TYPE_TERMS)
+        )))
+        columns = {term: i for i, term in enumerate(self._terms)}
+        
+        # Overlapping occurrences come straight out of the automaton when pyahocorasick is installed
+        self._automaton = None
+        if AHOCORASICK_AVAILABLE:
+            self._automaton = ahocorasick.Automaton()
+            for term, column in columns.items():
+                self._automaton.add_word(term, column)
+            self._automaton.make_automaton()
+        
+        # Otherwise one alternation, longest terms first, so each search reports the longest term at its offset
+        self._term_re = re.compile('|'.join(re.escape(term) for term in sorted(self._terms, key=len, reverse=True)))
+        # Every shorter term starting at the same offset is a prefix of that match: (column, length) pairs
+        self._match_columns = {
+            term: [(columns[other], len(other)) for other in self._terms if term.startswith(other)]
+            for term in self._terms
+        }
+        
+        self._keyword_vector = np.array([self._keyword_weights.get(term, 0) for term in self._terms], dtype=np.int64)
+        self._telecom_columns = [columns[term] for term in sorted(self.TELECOM_TERMS)]
+        self._service_columns = [columns[term] for term in sorted(self.SERVICE_TERMS)]
+        self._type_columns = [
+            (isp_type, [columns[term] for term in sorted(terms)]) for isp_type, terms in self.ISP_TYPE_TERMS
+        ]
     
     def classify(self, business_data: Dict[str, Any]) -> Dict[str, Any]:
         """Classify ISP businesses with detailed categorization."""
-        business_name = business_data.get('business_name', '').lower()
-        description = business_data.get('business_description', '').lower()
-        service_type = business_data.get('service_type', '').lower()
-        
-        # Determine ISP type
-        isp_type = self._determine_isp_type(business_name, description, service_type)
-        
-        # Calculate confidence based on keyword matches
-        confidence = self._calculate_confidence(business_name, description)
+        return _first_record(self.classify_batch(pd.DataFrame([business_data])))
+    
+    def classify_batch(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Classify a frame of ISP records column-wise.
         
-        return {
+        Args:
+            df: Business records, one row per business
+            
+        Returns:
+            Classification columns aligned to df's index
+        """
+        name = _lower_text(df, 'business_name')
+        description = _lower_text(df, 'business_description')
+        service_type = _lower_text(df, 'service_type')
+        
+        confidence_text = name + ' ' + description
+        type_hits, confidence_hits = self._term_hits(
+            (confidence_text + ' ' + service_type).tolist(), confidence_text.str.len().tolist()
+        )
+        
+        isp_type = np.select(
+            [type_hits[:, columns].any(axis=1) for _, columns in self._type_columns],
+            [isp_type for isp_type, _ in self._type_columns],
+            default='Mixed/Other'
+        )
+        # np.select returns fixed-width strings; map back to one shared str per type
+        isp_type = pd.Series([_intern(value) for value in isp_type.tolist()], index=df.index, dtype=object)
+        
+        # Direct ISP keywords, plus bonuses for telecommunications context and service type indicators
+        score = confidence_hits.astype(np.int64) @ self._keyword_vector
+        score += np.where(confidence_hits[:, self._telecom_columns].any(axis=1), 15, 0)
+        score += np.where(confidence_hits[:, self._service_columns].any(axis=1), 10, 0)
+        
+        return pd.DataFrame({
             'naics_code': '517311',  # Wired Telecommunications Carriers
             'industry_category': 'Telecommunications',
             'industry_description': 'Internet Service Providers',
             'isp_type': isp_type,
-            'confidence_score': confidence,
+            'confidence_score': np.minimum(score, 100),
             'classification_method': 'keyword_matching'
-        }
+        }, index=df.index)
     
-    def _determine_isp_type(self, name: str, description: str, service_type: str) -> str:
-        """Determine the type of ISP based on available information."""
-        combined_text = f"{name} {description} {service_type}"
-        
-        if any(word in combined_text for word in ['fiber', 'fibre']):
-            return 'Fiber'
-        elif any(word in combined_text for word in ['cable', 'coax']):
-            return 'Cable'
-        elif any(word in combined_text for word in ['satellite']):
-            return 'Satellite'
-        elif any(word in combined_text for word in ['dsl', 'digital subscriber']):
-            return 'DSL'
-        elif any(word in combined_text for word in ['wireless', 'radio']):
-            return 'Wireless'
-        else:
-            return 'Mixed/Other'
-    
-    def _calculate_confidence(self, name: str, description: str) -> int:
-        """Calculate confidence score for ISP classification."""
-        combined_text = f"{name} {description}"
-        score = 0
-        
-        # Check for direct ISP keywords
-        for keyword in self.isp_keywords:
-            if keyword in combined_text:
-                if keyword in ['internet service provider', 'isp']:
-                    score += 30
-                elif keyword in ['broadband', 'internet']:
-                    score += 20
-                else:
-                    score += 10
-        
-        # Bonus for telecommunications context
-        if any(word in combined_text for word in ['telecommunications', 'telecom']):
-            score += 15
-        
-        # Bonus for service type indicators
-        if any(word in combined_text for word in ['fiber', 'cable', 'satellite', 'dsl']):
-            score += 10
-        
-        return min(score, 100)
+    def _term_ends(self, text: str) -> List[Tuple[int, int]]:
+        """(column, end offset) of every known term occurring in text, overlaps included."""
+        if self._automaton is not None:
+            return [(column, end + 1) for end, column in self._automaton.iter(text)]
+        
+        found = []
+        match = self._term_re.search(text)
+        while match:
+            start = match.start()
+            found.extend((column, start + length) for column, length in self._match_columns[match.group()])
+            # Restart one character later so overlapping terms are found too
+            match = self._term_re.search(text, start + 1)
+        return found
+    
+    def _term_hits(self, texts: List[str], confidence_lengths: List[int]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Term hit matrices for type and confidence scoring from one scan per record.
+        
+        Each text is the confidence text followed by the service type, so a term counts
+        towards confidence only if it ends within the first confidence_lengths characters.
+        """
+        type_rows, type_columns, confidence_rows, confidence_columns = [], [], [], []
+        for row, (text, limit) in enumerate(zip(texts, confidence_lengths)):
+            for column, end in self._term_ends(text):
+                type_rows.append(row)
+                type_columns.append(column)
+                if end <= limit:
+                    confidence_rows.append(row)
+                    confidence_columns.append(column)
+        
+        type_hits = np.zeros((len(texts), len(self._terms)), dtype=bool)
+        confidence_hits = np.zeros_like(type_hits)
+        type_hits[type_rows, type_columns] = True
+        confidence_hits[confidence_rows, confidence_columns] = True
+        return type_hits, confidence_hits
 
 class ISPDataValidator:
     """Data validator specialized for ISP business data."""
     
+    # Quality score weights in hundredths: name, address, phone, valid phone,
+    # website, valid website, description, service type, coverage
+    SCORE_WEIGHTS = np.array([25, 15, 20, 5, 15, 5, 15, 5, 5], dtype=np.int64)
+    
     def validate(self, business_data: Dict[str, Any]) -> Dict[str, Any]:
         """Validate ISP business data quality."""
-        score = 0.0
-        flags = []
-        
-        # Required fields validation
-        if business_data.get('business_name'):
-            score += 0.25
-        else:
-            flags.append('missing_business_name')
-        
-        if business_data.get('address'):
-            score += 0.15
-        else:
-            flags.append('missing_address')
-        
-        if business_data.get('phone_number'):
-            score += 0.20
-            if self._validate_phone(business_data['phone_number']):
-                score += 0.05
-            else:
-                flags.append('invalid_phone_format')
-        else:
-            flags.append('missing_phone')
-        
-        if business_data.get('website'):
-            score += 0.15
-            if self._validate_website(business_data['website']):
-                score += 0.05
-            else:
-                flags.append('invalid_website_format')
-        else:
-            flags.append('missing_website')
-        
-        if business_data.get('business_description'):
-            score += 0.15
-        else:
-            flags.append('missing_description')
-        
-        # ISP-specific validation
-        if business_data.get('service_type'):
-            score += 0.05
-        
-        if business_data.get('coverage'):
-            score += 0.05
-        
-        return {
-            'quality_score': round(score, 2),
-            'phone_valid': self._validate_phone(business_data.get('phone_number', '')),
-            'website_valid': self._validate_website(business_data.get('website', '')),
-            'validation_flags': flags
-        }
+        return _first_record(self.validate_batch(pd.DataFrame([business_data])))
     
-    def _validate_phone(self, phone: str) -> bool:
-        """Validate phone number format."""
-        if not phone:
-            return False
-        # Basic US phone number pattern
-        phone_pattern = r'^\(?([0-9]{3})\)?[-. ]?([0-9]{3})[-. ]?([0-9]{4})$'
-        return bool(re.match(phone_pattern, phone.strip()))
+    def validate_batch(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Validate a frame of ISP records column-wise.
+        
+        Args:
+            df: Business records, one row per business
+            
+        Returns:
+            Validation columns aligned to df's index
+        """
+        has_name = _is_present(df, 'business_name')
+        has_address = _is_present(df, 'address')
+        has_phone = _is_present(df, 'phone_number')
+        has_website = _is_present(df, 'website')
+        has_description = _is_present(df, 'business_description')
+        
+        phone = _text(df, 'phone_number')
+        phone_valid = has_phone & phone.str.strip().str.match(_PHONE_RE).to_numpy(dtype=bool)
+        website_valid = has_website & np.fromiter(
+            (self._validate_website(website) for website in _text(df, 'website')),
+            dtype=bool, count=len(df)
+        )
+        
+        presence = np.column_stack([
+            has_name, has_address,
+            has_phone, phone_valid,
+            has_website, website_valid,
+            has_description,
+            _is_present(df, 'service_type'), _is_present(df, 'coverage')
+        ])
+        # Integer hundredths keep the sum exact before rounding to two decimals
+        score = (presence.astype(np.int64) @ self.SCORE_WEIGHTS) / 100
+        
+        flag_labels = (
+            'missing_business_name', 'missing_address',
+            'invalid_phone_format', 'missing_phone',
+            'invalid_website_format', 'missing_website',
+            'missing_description'
+        )
+        flag_matrix = np.column_stack([
+            ~has_name, ~has_address,
+            has_phone & ~phone_valid, ~has_phone,
+            has_website & ~website_valid, ~has_website,
+            ~has_description
+        ])
+        
+        return pd.DataFrame({
+            'quality_score': [round(value, 2) for value in score.tolist()],
+            'phone_valid': phone_valid,
+            'website_valid': website_valid,
+            'validation_flags': [list(compress(flag_labels, row)) for row in flag_matrix]
+        }, index=df.index)
     
-    def _validate_website(self, website: str) -> bool:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _validate_website(website: str) -> bool:
         """Validate website URL format."""
         if not website:
             return False
+        # Plain http(s) URLs with an ASCII host are valid without a full urlparse
+        if _SIMPLE_URL_RE.match(website):
+            return True
         try:
             result = urlparse(website)
             return all([result.scheme, result.netloc])
@@ -419,54 +599,72 @@ class ISPDataValidator:
 class ISPCSVGenerator:
     """CSV generator for ISP lead data."""
     
+    # CSV header -> (record field, default when missing)
+    COLUMN_MAP = {
+        'company_name': ('business_name', ''),
+        'business_address': ('address', ''),
+        'phone_number': ('phone_number', ''),
+        'website_url': ('website', ''),
+        'business_description': ('business_description', ''),
+        'isp_type': ('isp_type', ''),
+        'service_coverage': ('coverage', ''),
+        'naics_code': ('naics_code', ''),
+        'industry_description': ('industry_description', ''),
+        'data_quality_score': ('quality_score', 0),
+        'confidence_score': ('confidence_score', 0),
+        'source_attribution': ('source', ''),
+        'validation_flags': ('validation_flags', None)
+    }
+    
     def __init__(self):
         os.makedirs('data/outputs', exist_ok=True)
     
-    def generate(self, data: List[Dict[str, Any]], location: str) -> str:
-        """Generate CSV file for ISP leads."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    def generate(
+        self,
+        data: Union[pd.DataFrame, Iterable[Dict[str, Any]]],
+        location: str,
+        timestamp: Optional[str] = None
+    ) -> str:
+        """Generate CSV file for ISP leads, streaming rows from a frame or any iterable of records."""
+        timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"isp_leads_{location.lower().replace(' ', '_')}_{timestamp}.csv"
         filepath = os.path.join('data/outputs', filename)
         
-        headers = [
-            'company_name',
-            'business_address',
-            'phone_number',
-            'website_url',
-            'business_description',
-            'isp_type',
-            'service_coverage',
-            'naics_code',
-            'industry_description',
-            'data_quality_score',
-            'confidence_score',
-            'source_attribution',
-            'validation_flags'
-        ]
+        rows = self._frame_rows(data) if isinstance(data, pd.DataFrame) else self._record_rows(data)
         
-        with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=headers)
-            writer.writeheader()
-            
-            for business in data:
-                row = {
-                    'company_name': business.get('business_name', ''),
-                    'business_address': business.get('address', ''),
-                    'phone_number': business.get('phone_number', ''),
-                    'website_url': business.get('website', ''),
-                    'business_description': business.get('business_description', ''),
-                    'isp_type': business.get('isp_type', ''),
-                    'service_coverage': business.get('coverage', ''),
-                    'naics_code': business.get('naics_code', ''),
-                    'industry_description': business.get('industry_description', ''),
-                    'data_quality_score': business.get('quality_score', 0),
-                    'confidence_score': business.get('confidence_score', 0),
-                    'source_attribution': business.get('source', ''),
-                    'validation_flags': '; '.join(business.get('validation_flags', []))
-                }
-                writer.writerow(row)
+        # 1 MiB buffer so large exports are flushed in a few big writes
+        with open(filepath, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(self.COLUMN_MAP)
+            writer.writerows(rows)
         
         return filepath
+    
+    def _frame_rows(self, df: pd.DataFrame) -> Iterator[tuple]:
+        """Yield CSV row tuples by zipping the frame's columns, with defaults filled per column."""
+        columns = []
+        for header, (column, default) in self.COLUMN_MAP.items():
+            if header == 'validation_flags':
+                flags = df[column] if column in df else repeat(None, len(df))
+                columns.append(_join_flags(value) for value in flags)
+            elif column not in df:
+                columns.append(repeat(default, len(df)))
+            else:
+                values = df[column]
+                columns.append((values.fillna(default) if values.hasnans else values).to_numpy())
+        return zip(*columns)
+    
+    def _record_rows(self, records: Iterable[Dict[str, Any]]) -> Iterator[List[Any]]:
+        """Lazily map record dicts onto CSV rows, one at a time."""
+        # validation_flags is the last column and is rendered separately
+        fields = list(self.COLUMN_MAP.values())[:-1]
+        for business in records:
+            row = []
+            for column, default in fields:
+                value = business.get(column, default)
+                row.append(default if _is_missing(value) else value)
+            row.append(_join_flags(business.get('validation_flags')))
+            yield row
 
 class NCISPLeadGenerator:
     """Main lead generator for North Carolina ISPs."""
@@ -477,6 +675,9 @@ class NCISPLeadGenerator:
         self.validator = ISPDataValidator()
         self.csv_generator = ISPCSVGenerator()
         
+        # Output file stamp for this run, computed once
+        self.run_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        
         logger.info("NC ISP Lead Generator initialized successfully")
     
     async def generate_isp_leads(self) -> Dict[str, Any]:
@@ -488,16 +689,22 @@ class NCISPLeadGenerator:
         # Step 1: Collect data from multiple sources
         logger.info("Step 1: Collecting ISP data from multiple sources")
         
-        # Scrape Yellow Pages
-        yp_data = self.scraper.scrape_yellow_pages_isp("North Carolina")
+        # Scrape Yellow Pages while the FCC/industry and local directory data load in worker threads
+        yp_task = asyncio.create_task(self.scraper.scrape_yellow_pages_isp("North Carolina"))
+        try:
+            yp_data, fcc_data, local_data = await asyncio.gather(
+                yp_task,
+                asyncio.to_thread(self.scraper.scrape_fcc_broadband_providers, "North Carolina"),
+                asyncio.to_thread(self.scraper.scrape_local_isp_directories)
+            )
+        finally:
+            if not yp_task.done():
+                yp_task.cancel()
+            await self.scraper.close()
+
+        # Keep Yellow Pages first so deduplication prefers scraped records as before
         all_data.extend(yp_data)
-        
-        # Get FCC/industry data
-        fcc_data = self.scraper.scrape_fcc_broadband_providers("North Carolina")
         all_data.extend(fcc_data)
-        
-        # Get local directory data
-        local_data = self.scraper.scrape_local_isp_directories()
         all_data.extend(local_data)
         
         logger.info(f"Collected {len(all_data)} total business records")
@@ -507,45 +714,44 @@ class NCISPLeadGenerator:
         deduplicated_data = self._deduplicate_businesses(all_data)
         logger.info(f"After deduplication: {len(deduplicated_data)} unique businesses")
         
+        # Records are processed column-wise from here on
+        df = pd.DataFrame(deduplicated_data, dtype=object)
+        
         # Step 3: Classify industries
         logger.info("Step 3: Classifying industries")
-        classified_data = []
-        for business in deduplicated_data:
-            classification = self.classifier.classify(business)
-            business.update(classification)
-            classified_data.append(business)
+        if len(df):
+            df = df.assign(**self.classifier.classify_batch(df))
+        classified_count = len(df)
         
         # Step 4: Validate data
         logger.info("Step 4: Validating data quality")
-        validated_data = []
-        for business in classified_data:
-            validation = self.validator.validate(business)
-            business.update(validation)
-            validated_data.append(business)
+        if len(df):
+            df = df.assign(**self.validator.validate_batch(df))
+        validated_count = len(df)
         
         # Step 5: Generate CSV
         logger.info("Step 5: Generating CSV output")
-        csv_file_path = self.csv_generator.generate(validated_data, "North Carolina")
+        csv_file_path = self.csv_generator.generate(df, "North Carolina", timestamp=self.run_timestamp)
         
         # Compile results
-        high_quality_leads = [d for d in validated_data if d.get('quality_score', 0) > 0.7]
+        high_quality_count = int((df['quality_score'] > 0.7).sum()) if len(df) else 0
         
         results = {
             'csv_file_path': csv_file_path,
-            'total_leads': len(validated_data),
-            'high_quality_leads': len(high_quality_leads),
+            'total_leads': validated_count,
+            'high_quality_leads': high_quality_count,
             'sources_used': ['yellow_pages', 'fcc_broadband_data', 'local_directories'],
             'processing_summary': {
                 'collected': len(all_data),
                 'deduplicated': len(deduplicated_data),
-                'classified': len(classified_data),
-                'validated': len(validated_data),
-                'high_quality': len(high_quality_leads)
+                'classified': classified_count,
+                'validated': validated_count,
+                'high_quality': high_quality_count
             }
         }
         
         logger.info(f"ISP lead generation completed successfully")
-        logger.info(f"Generated {len(validated_data)} total leads, {len(high_quality_leads)} high quality")
+        logger.info(f"Generated {validated_count} total leads, {high_quality_count} high quality")
         logger.info(f"CSV file saved to: {csv_file_path}")
         
         return results
@@ -556,8 +762,8 @@ class NCISPLeadGenerator:
         seen_names = set()
         
         for business in data:
-            name = business.get('business_name', '').lower().strip()
-            # Simplified deduplication - can be enhanced with fuzzy matching
+            name = _canonical_name(business.get('business_name', ''))
+            # Canonical-form deduplication - can be enhanced with fuzzy matching
             if name and name not in seen_names:
                 seen_names.add(name)
                 unique_businesses.append(business)
@@ -591,4 +797,7 @@ async def main():
         return None
 
 if __name__ == "__main__":
+    # The loop policy must be set before asyncio.run creates the loop
+    if UVLOOP_AVAILABLE:
+        uvloop.install()
     asyncio.run(main())
\ No newline at end of file
@@ -11,6 +11,7 @@ import json
 import logging
 import os
 import platform
+import shutil
 import subprocess
 import sys
 import time
@@ -18,7 +19,18 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 import aiohttp
-import requests
+
+try:
+    import uvloop  # Linux/macOS only
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Setup logging
 logging.basicConfig(
@@ -27,6 +39,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def _loads(data: bytes):
+    """Parse a JSON document or stream line, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _dumps_config(config: Dict) -> bytes:
+    """Serialize a config to indented JSON bytes, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, indent=2).encode('utf-8')
+
 class OllamaSetup:
     """Ollama setup and configuration manager."""
     
@@ -41,8 +65,74 @@ class OllamaSetup:
             "phi3:mini"
         ]
         
+        # Host facts don't change during a run; resolve them once
+        self._system = platform.system().lower()
+        self._requirements: Optional[Dict[str, bool]] = None
+        
+        # OLLAMA_NUM_PARALLEL the server was started with, when this script started it
+        self._server_num_parallel: Optional[str] = None
+        
+        # Created lazily inside the running event loop and reused for every local API call
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # Set by a background watcher once the API answers; also loop-bound, so created lazily
+        self._ready_event: Optional[asyncio.Event] = None
+        self._ready_watcher: Optional[asyncio.Task] = None
+        
+        # How long the server keeps a model loaded after warmup and test requests
+        self.keep_alive = "5m"
+        
+        # Concurrent model pulls; more than a couple just split the same bandwidth
+        self.max_parallel_pulls = self._pull_concurrency()
+        self.progress_interval = 0.1  # seconds between printed progress updates per pull
+        self.pull_stall_timeout = 60.0  # seconds without progress before a pull is abandoned
+        self._pull_semaphore: Optional[asyncio.Semaphore] = None
+        
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            # Keep-alive connections to the local server are reused across probes, tests and pulls;
+            # the host name is resolved once and cached for the rest of the run
+            connector = aiohttp.TCPConnector(
+                limit=16,
+                limit_per_host=8,
+                ttl_dns_cache=300,
+                keepalive_timeout=60
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+    
+    async def start(self):
+        """Open the shared HTTP session up front, before the first API call."""
+        await self._ensure_session()
+    
+    async def close(self):
+        """Stop the readiness watcher and close the shared HTTP session."""
+        self._stop_ready_watcher()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    @staticmethod
+    def _pull_concurrency() -> int:
+        """Concurrent pull limit from CRM_OLLAMA_PULL_CONCURRENCY, else sized to the CPU."""
+        configured = os.environ.get('CRM_OLLAMA_PULL_CONCURRENCY', '')
+        if configured.isdigit() and int(configured) > 0:
+            return int(configured)
+        
+        # Pulls also hash and decompress layers, so small machines get one at a time
+        try:
+            import psutil
+            cores = psutil.cpu_count(logical=False) or 1
+        except ImportError:
+            cores = os.cpu_count() or 1
+        return 1 if cores < 4 else 2
+    
     def check_system_requirements(self) -> Dict[str, bool]:
         """Check system requirements for Ollama."""
+        if self._requirements is not None:
+            return dict(self._requirements)
+        
         requirements = {
             'os_supported': False,
             'memory_sufficient': False,
@@ -51,8 +141,7 @@ class OllamaSetup:
         }
         
         # Check OS
-        system = platform.system().lower()
-        requirements['os_supported'] = system in ['windows', 'darwin', 'linux']
+        requirements['os_supported'] = self._system in ['windows', 'darwin', 'linux']
         
         # Check Python version
         requirements['python_version'] = sys.version_info >= (3, 9)
@@ -66,30 +155,29 @@ class OllamaSetup:
             logger.warning("psutil not available, skipping memory check")
             requirements['memory_sufficient'] = True
         
-        # Check disk space
+        # Check disk space (shutil.disk_usage also works on Windows)
         try:
-            disk_usage = os.statvfs('.')
-            free_gb = (disk_usage.f_frsize * disk_usage.f_bavail) / (1024**3)
+            free_gb = shutil.disk_usage('.').free / (1024**3)
             requirements['disk_space_sufficient'] = free_gb >= 10
-        except (AttributeError, OSError):
-            # Windows doesn't have statvfs
+        except OSError:
             requirements['disk_space_sufficient'] = True
         
-        return requirements
+        self._requirements = requirements
+        return dict(requirements)
     
-    def install_ollama(self) -> bool:
+    async def install_ollama(self) -> bool:
         """Install Ollama based on the operating system."""
-        system = platform.system().lower()
+        system = self._system
         
         logger.info(f"Installing Ollama for {system}...")
         
         try:
             if system == 'windows':
-                return self._install_ollama_windows()
+                return await self._install_ollama_windows()
             elif system == 'darwin':
-                return self._install_ollama_macos()
+                return await self._install_ollama_macos()
             elif system == 'linux':
-                return self._install_ollama_linux()
+                return await self._install_ollama_linux()
             else:
                 logger.error(f"Unsupported operating system: {system}")
                 return False
@@ -97,7 +185,7 @@ class OllamaSetup:
             logger.error(f"Failed to install Ollama: {e}")
             return False
     
-    def _install_ollama_windows(self) -> bool:
+    async def _install_ollama_windows(self) -> bool:
         """Install Ollama on Windows."""
         logger.info("Please install Ollama manually on Windows:")
         logger.info("1. Go to https://ollama.ai/download")
@@ -105,207 +193,391 @@ class OllamaSetup:
         logger.info("3. Run the installer and follow the instructions")
         logger.info("4. Restart your terminal/command prompt")
         
-        input("Press Enter after installing Ollama...")
-        return self.check_ollama_installation()
+        return await self._wait_for_manual_install()
     
-    def _install_ollama_macos(self) -> bool:
+    async def _install_ollama_macos(self) -> bool:
         """Install Ollama on macOS."""
-        try:
-            # Try using Homebrew first
-            result = subprocess.run(['brew', '--version'], capture_output=True, text=True)
-            if result.returncode == 0:
-                logger.info("Installing Ollama via Homebrew...")
-                result = subprocess.run(['brew', 'install', 'ollama'], check=True)
-                return True
-            else:
-                logger.info("Homebrew not found. Please install Ollama manually:")
-                logger.info("1. Go to https://ollama.ai/download")
-                logger.info("2. Download the macOS installer")
-                logger.info("3. Run the installer")
-                input("Press Enter after installing Ollama...")
-                return self.check_ollama_installation()
-        except subprocess.CalledProcessError:
-            logger.error("Failed to install via Homebrew")
-            return False
+        # Try using Homebrew first
+        process = await asyncio.create_subprocess_exec(
+            'brew', '--version',
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        if await process.wait() == 0:
+            logger.info("Installing Ollama via Homebrew...")
+            process = await asyncio.create_subprocess_exec('brew', 'install', 'ollama')
+            if await process.wait() != 0:
+                logger.error("Failed to install via Homebrew")
+                return False
+            return True
+        else:
+            logger.info("Homebrew not found. Please install Ollama manually:")
+            logger.info("1. Go to https://ollama.ai/download")
+            logger.info("2. Download the macOS installer")
+            logger.info("3. Run the installer")
+            return await self._wait_for_manual_install()
+    
+    async def _wait_for_manual_install(self, timeout: float = 600.0) -> bool:
+        """Wait for a manually installed Ollama to come up instead of blocking on input()."""
+        # The desktop installers start the server, so its API answering means the install finished
+        logger.info(f"Waiting up to {timeout / 60:.0f} minutes for Ollama to start...")
+        if await self.wait_until_ready(timeout):
+            logger.info("Detected Ollama is now responsive")
+        return await self.check_ollama_installation()
     
-    def _install_ollama_linux(self) -> bool:
+    async def _install_ollama_linux(self) -> bool:
         """Install Ollama on Linux."""
-        try:
-            logger.info("Installing Ollama on Linux...")
-            
-            # Download and run the install script
-            install_command = "curl -fsSL https://ollama.ai/install.sh | sh"
-            result = subprocess.run(install_command, shell=True, check=True)
-            
-            logger.info("Ollama installed successfully")
-            return True
-            
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Failed to install Ollama: {e}")
+        logger.info("Installing Ollama on Linux...")
+        
+        # Download and run the install script, echoing its output as it arrives
+        install_command = "curl -fsSL https://ollama.ai/install.sh | sh"
+        process = await asyncio.create_subprocess_shell(
+            install_command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT
+        )
+        async for line in process.stdout:
+            print(f"  {line.decode(errors='replace').rstrip()}")
+        
+        returncode = await process.wait()
+        if returncode != 0:
+            logger.error(f"Failed to install Ollama: '{install_command}' exited with status {returncode}")
             return False
+        
+        logger.info("Ollama installed successfully")
+        return True
     
-    def check_ollama_installation(self) -> bool:
+    async def check_ollama_installation(self) -> bool:
         """Check if Ollama is properly installed."""
+        # A running server answers /api/version without spawning the CLI
+        session = await self._ensure_session()
         try:
-            result = subprocess.run(['ollama', '--version'], capture_output=True, text=True)
-            if result.returncode == 0:
-                logger.info(f"Ollama version: {result.stdout.strip()}")
-                return True
-            else:
-                logger.error("Ollama not found in PATH")
-                return False
-        except FileNotFoundError:
-            logger.error("Ollama command not found")
-            return False
+            async with session.get(
+                f"{self.ollama_url}/api/version",
+                timeout=aiohttp.ClientTimeout(total=2)
+            ) as response:
+                if response.status == 200:
+                    version = _loads(await response.read()).get('version', 'unknown')
+                    logger.info(f"Ollama version: {version}")
+                    return True
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+            pass
+        
+        # Not running yet; installed is enough, the service is started later
+        return self._ollama_on_path()
     
-    def start_ollama_service(self) -> bool:
-        """Start the Ollama service."""
+    def _ollama_on_path(self) -> bool:
+        """Check for the ollama executable on PATH without running it."""
+        if shutil.which('ollama'):
+            logger.info("Ollama found in PATH")
+            return True
+        logger.error("Ollama not found in PATH")
+        return False
+    
+    async def start_ollama_service(self, timeout: float = 30.0) -> bool:
+        """Start the Ollama service and wait until its API responds."""
         try:
             logger.info("Starting Ollama service...")
             
-            # Check if already running
-            if self.check_ollama_service():
+            # Check if already running with the same short probe the readiness watcher uses
+            if await self._probe_ollama():
                 logger.info("Ollama service is already running")
                 return True
             
-            # Start the service
-            system = platform.system().lower()
-            if system == 'windows':
+            # Start the service; Popen rather than an asyncio subprocess so the server
+            # outlives this script's event loop instead of being killed with its transport
+            env = self._server_env()
+            if self._system == 'windows':
                 # On Windows, Ollama usually starts automatically
-                subprocess.Popen(['ollama', 'serve'], creationflags=subprocess.CREATE_NEW_CONSOLE)
+                subprocess.Popen(['ollama', 'serve'], env=env, creationflags=subprocess.CREATE_NEW_CONSOLE)
             else:
                 # On Unix-like systems
-                subprocess.Popen(['ollama', 'serve'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                subprocess.Popen(['ollama', 'serve'], env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             
             # Wait for service to start
-            for i in range(30):  # Wait up to 30 seconds
-                time.sleep(1)
-                if self.check_ollama_service():
-                    logger.info("Ollama service started successfully")
-                    return True
+            if not await self.wait_until_ready(timeout):
+                logger.error(f"Ollama service failed to start within {timeout:.0f} seconds")
+                return False
             
-            logger.error("Ollama service failed to start within 30 seconds")
-            return False
+            logger.info("Ollama service started successfully")
+            return True
             
         except Exception as e:
             logger.error(f"Failed to start Ollama service: {e}")
             return False
     
-    def check_ollama_service(self) -> bool:
-        """Check if Ollama service is running."""
+    def _server_env(self) -> Dict[str, str]:
+        """Environment for `ollama serve`, sizing parallelism unless the user already set it."""
+        env = dict(os.environ)
+        
+        # The server queues requests beyond OLLAMA_NUM_PARALLEL, which would serialize concurrent tests
+        if 'OLLAMA_NUM_PARALLEL' not in env:
+            try:
+                import psutil
+                memory_gb = psutil.virtual_memory().total / (1024**3)
+                env['OLLAMA_NUM_PARALLEL'] = str(min(4, max(2, int(memory_gb // 8))))
+            except ImportError:
+                env['OLLAMA_NUM_PARALLEL'] = '2'
+        env.setdefault('OLLAMA_MAX_LOADED_MODELS', str(max(2, len(self.required_models))))
+        
+        self._server_num_parallel = env['OLLAMA_NUM_PARALLEL']
+        logger.info(
+            f"Starting Ollama with OLLAMA_NUM_PARALLEL={env['OLLAMA_NUM_PARALLEL']} "
+            f"OLLAMA_MAX_LOADED_MODELS={env['OLLAMA_MAX_LOADED_MODELS']} "
+            "(set either variable to override)"
+        )
+        return env
+    
+    async def wait_until_ready(self, timeout: float) -> bool:
+        """
+        Wait for the readiness watcher to see the API answer.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            True if the service became ready, False on timeout
+        """
+        if self._ready_event is None:
+            self._ready_event = asyncio.Event()
+        if not self._ready_event.is_set() and (self._ready_watcher is None or self._ready_watcher.done()):
+            self._ready_watcher = asyncio.create_task(self._watch_ready())
+        
         try:
-            response = requests.get(f"{self.ollama_url}/api/tags", timeout=5)
-            return response.status_code == 200
-        except requests.RequestException:
+            await asyncio.wait_for(self._ready_event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            self._stop_ready_watcher()
+            return False
+    
+    async def _watch_ready(self):
+        """Probe the API with capped exponential backoff and signal the first success."""
+        attempt = 0
+        while not await self._probe_ollama():
+            await asyncio.sleep(min(0.1 * 2 ** attempt, 1.0))
+            attempt += 1
+        self._ready_event.set()
+    
+    def _stop_ready_watcher(self):
+        """Cancel a readiness watcher that is still probing."""
+        if self._ready_watcher is not None and not self._ready_watcher.done():
+            self._ready_watcher.cancel()
+        self._ready_watcher = None
+    
+    async def _probe_ollama(self) -> bool:
+        """Single short-timeout probe of the API."""
+        session = await self._ensure_session()
+        try:
+            async with session.get(
+                f"{self.ollama_url}/api/tags",
+                timeout=aiohttp.ClientTimeout(total=0.5)
+            ) as response:
+                return response.status == 200
+        except (aiohttp.ClientError, asyncio.TimeoutError):
             return False
     
     async def download_models(self, models: List[str] = None) -> Dict[str, bool]:
         """Download required models."""
         models = models or self.required_models
-        results = {}
         
-        for model in models:
-            logger.info(f"Downloading model: {model}")
-            success = await self._download_single_model(model)
-            results[model] = success
-            
-            if success:
-                logger.info(f"✅ Successfully downloaded {model}")
-            else:
-                logger.error(f"❌ Failed to download {model}")
+        logger.info(
+            f"Pulling {len(models)} model(s), up to {self.max_parallel_pulls} at a time "
+            "(set CRM_OLLAMA_PULL_CONCURRENCY to change)"
+        )
         
-        return results
+        # Pulls are network-bound, so run them side by side; each reports its own outcome
+        return dict(zip(models, await asyncio.gather(*(self._download_single_model(model) for model in models))))
     
     async def _download_single_model(self, model: str) -> bool:
-        """Download a single model."""
+        """Download a single model and log the outcome as soon as it is known."""
+        success = await self._pull_model(model)
+        if success:
+            logger.info(f"✅ Successfully downloaded {model}")
+        else:
+            logger.error(f"❌ Failed to download {model}")
+        return success
+    
+    async def _pull_model(self, model: str) -> bool:
+        """Pull a single model through the REST API."""
+        if self._pull_semaphore is None:
+            self._pull_semaphore = asyncio.Semaphore(self.max_parallel_pulls)
+        
         try:
-            # Use subprocess to run ollama pull
-            process = subprocess.Popen(
-                ['ollama', 'pull', model],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            
-            # Monitor progress
-            while True:
-                output = process.stdout.readline()
-                if output == '' and process.poll() is not None:
-                    break
-                if output:
-                    # Simple progress indication
-                    if 'pulling' in output.lower():
-                        print(f"  {output.strip()}")
-            
-            return_code = process.poll()
-            return return_code == 0
+            async with self._pull_semaphore:
+                logger.info(f"Downloading model: {model}")
+                
+                session = await self._ensure_session()
+                
+                # The server streams one JSON progress object per line; pulls can take far
+                # longer than the session's default total timeout, so bound the connect and
+                # the gap between reads instead, which fails a stalled pull without capping a slow one
+                async with session.post(
+                    f"{self.ollama_url}/api/pull",
+                    json={"model": model, "name": model, "stream": True},
+                    timeout=aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=self.pull_stall_timeout)
+                ) as response:
+                    if response.status != 200:
+                        logger.error(f"Pull request for {model} failed: HTTP {response.status}")
+                        return False
+                    
+                    return await self._read_pull_progress(model, response)
             
+        except asyncio.TimeoutError:
+            logger.error(f"Download of {model} stalled: no progress for {self.pull_stall_timeout:.0f}s")
+            return False
         except Exception as e:
             logger.error(f"Error downloading model {model}: {e}")
             return False
     
-    def list_available_models(self) -> List[str]:
+    async def _read_pull_progress(self, model: str, response: aiohttp.ClientResponse) -> bool:
+        """Consume a pull's progress stream, printing at most one update per progress_interval."""
+        pending = None
+        last_emit = 0.0
+        
+        try:
+            async for line in response.content:
+                if not line.strip():
+                    continue
+                progress = _loads(line)
+                
+                if 'error' in progress:
+                    logger.error(f"Error downloading model {model}: {progress['error']}")
+                    return False
+                
+                status = progress.get('status', '')
+                if status == 'success':
+                    return True
+                
+                # Simple progress indication, tagged by model since pulls interleave
+                if 'pulling' in status.lower():
+                    if progress.get('total'):
+                        percent = 100 * progress.get('completed', 0) / progress['total']
+                        pending = f"  [{model}] {status} {percent:.0f}%"
+                    else:
+                        pending = f"  [{model}] {status}"
+                    
+                    # The server sends many updates per second; only the latest one matters
+                    now = time.monotonic()
+                    if now - last_emit >= self.progress_interval:
+                        sys.stdout.write(pending + '\n')
+                        sys.stdout.flush()
+                        last_emit = now
+                        pending = None
+            
+            # Stream ended without the terminal success status
+            return False
+        
+        finally:
+            # Always show where the pull got to
+            if pending is not None:
+                sys.stdout.write(pending + '\n')
+                sys.stdout.flush()
+    
+    async def list_available_models(self) -> List[str]:
         """List models available on the system."""
         try:
-            result = subprocess.run(['ollama', 'list'], capture_output=True, text=True)
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')[1:]  # Skip header
-                models = [line.split()[0] for line in lines if line.strip()]
-                return models
-            else:
-                return []
+            session = await self._ensure_session()
+            async with session.get(
+                f"{self.ollama_url}/api/tags",
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                if response.status != 200:
+                    return []
+                data = _loads(await response.read())
+                return [model['name'] for model in data.get('models', [])]
         except Exception as e:
             logger.error(f"Error listing models: {e}")
             return []
     
+    async def warmup_models(self, models: List[str] = None) -> Dict[str, bool]:
+        """Load models into memory ahead of testing so the tests don't pay the load time."""
+        models = models or self.required_models
+        outcomes = await asyncio.gather(*(self._warmup_single_model(model) for model in models))
+        return dict(zip(models, outcomes))
+    
+    async def _warmup_single_model(self, model: str) -> bool:
+        """Load one model with an empty prompt, which generates nothing."""
+        try:
+            session = await self._ensure_session()
+            async with session.post(
+                f"{self.ollama_url}/api/generate",
+                json={"model": model, "prompt": "", "stream": False, "keep_alive": self.keep_alive},
+                timeout=aiohttp.ClientTimeout(total=120)
+            ) as response:
+                return response.status == 200
+        except Exception as e:
+            logger.warning(f"Could not preload model {model}: {e}")
+            return False
+    
     async def test_models(self, models: List[str] = None) -> Dict[str, Dict]:
         """Test models with sample prompts."""
         models = models or self.required_models
-        results = {}
         
         test_prompt = "Classify this business: 'Joe's Pizza Restaurant' into an industry category."
         
-        for model in models:
-            logger.info(f"Testing model: {model}")
-            result = await self._test_single_model(model, test_prompt)
-            results[model] = result
+        # The server queues requests beyond OLLAMA_NUM_PARALLEL, so concurrent tests only overlap up to that limit
+        num_parallel = self._server_num_parallel or os.environ.get('OLLAMA_NUM_PARALLEL')
+        if len(models) > 1 and (not num_parallel or not num_parallel.isdigit() or int(num_parallel) < len(models)):
+            logger.info(
+                f"OLLAMA_NUM_PARALLEL is {num_parallel or 'unset'}; set it to at least {len(models)} "
+                "before starting Ollama to run all model tests in parallel"
+            )
         
-        return results
+        return dict(zip(models, await asyncio.gather(*(self._test_single_model(model, test_prompt) for model in models))))
     
     async def _test_single_model(self, model: str, prompt: str) -> Dict:
         """Test a single model."""
+        logger.info(f"Testing model: {model}")
         try:
-            async with aiohttp.ClientSession() as session:
-                payload = {
-                    "model": model,
-                    "prompt": prompt,
-                    "stream": False
-                }
+            session = await self._ensure_session()
+            payload = {
+                "model": model,
+                "prompt": prompt,
+                "stream": True,
+                "keep_alive": self.keep_alive
+            }
+            
+            start_time = time.time()
+            
+            async with session.post(
+                f"{self.ollama_url}/api/generate",
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
                 
-                start_time = time.time()
+                if response.status != 200:
+                    return {
+                        'success': False,
+                        'error': f"HTTP {response.status}",
+                        'response_time': time.time() - start_time
+                    }
                 
-                async with session.post(
-                    f"{self.ollama_url}/api/generate",
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    
-                    response_time = time.time() - start_time
-                    
-                    if response.status == 200:
-                        result = await response.json()
-                        return {
-                            'success': True,
-                            'response_time': response_time,
-                            'response': result.get('response', '')[:100] + '...',
-                            'tokens': result.get('eval_count', 0)
-                        }
-                    else:
+                # Streaming separates time to first token from full generation time
+                first_token_time = None
+                chunks = []
+                result = {}
+                async for line in response.content:
+                    if not line.strip():
+                        continue
+                    result = _loads(line)
+                    if 'error' in result:
                         return {
                             'success': False,
-                            'error': f"HTTP {response.status}",
-                            'response_time': response_time
+                            'error': result['error'],
+                            'response_time': time.time() - start_time
                         }
+                    if result.get('response'):
+                        if first_token_time is None:
+                            first_token_time = time.time() - start_time
+                        chunks.append(result['response'])
+                
+                return {
+                    'success': True,
+                    'response_time': time.time() - start_time,
+                    'first_token_time': first_token_time or 0,
+                    'response': ''.join(chunks)[:100] + '...',
+                    'tokens': result.get('eval_count', 0)
+                }
         
         except Exception as e:
             return {
@@ -314,9 +586,12 @@ class OllamaSetup:
                 'response_time': 0
             }
     
-    def create_config_file(self) -> bool:
+    async def create_config_file(self) -> bool:
         """Create Ollama configuration for the CRM system."""
         try:
+            # The server's tag list already includes this run's pulls and any earlier installs
+            available = await self.list_available_models()
+            
             config_dir = Path("config")
             config_dir.mkdir(exist_ok=True)
             
@@ -326,7 +601,7 @@ class OllamaSetup:
                     "models": {
                         "primary": self.required_models[0],
                         "backup": self.required_models[1] if len(self.required_models) > 1 else self.required_models[0],
-                        "available": self.list_available_models()
+                        "available": available
                     },
                     "settings": {
                         "timeout": 30,
@@ -337,8 +612,7 @@ class OllamaSetup:
             }
             
             config_file = config_dir / "ollama_config.json"
-            with open(config_file, 'w') as f:
-                json.dump(ollama_config, f, indent=2)
+            config_file.write_bytes(_dumps_config(ollama_config))
             
             logger.info(f"Configuration saved to {config_file}")
             return True
@@ -354,6 +628,14 @@ async def main():
     
     setup = OllamaSetup()
     
+    try:
+        await setup.start()
+        return await _run_setup(setup)
+    finally:
+        await setup.close()
+
+async def _run_setup(setup: OllamaSetup) -> bool:
+    """Run the setup steps; main() owns the session lifetime."""
     # Check system requirements
     print("\n📋 Checking system requirements...")
     requirements = setup.check_system_requirements()
@@ -368,9 +650,9 @@ async def main():
     
     # Check if Ollama is installed
     print("\n🔍 Checking Ollama installation...")
-    if not setup.check_ollama_installation():
+    if not await setup.check_ollama_installation():
         print("Ollama not found. Installing...")
-        if not setup.install_ollama():
+        if not await setup.install_ollama():
             print("❌ Failed to install Ollama")
             return False
     else:
@@ -378,7 +660,7 @@ async def main():
     
     # Start Ollama service
     print("\n🚀 Starting Ollama service...")
-    if not setup.start_ollama_service():
+    if not await setup.start_ollama_service():
         print("❌ Failed to start Ollama service")
         return False
     
@@ -395,17 +677,18 @@ async def main():
     
     # Test models
     print("\n🧪 Testing models...")
+    await setup.warmup_models()
     test_results = await setup.test_models()
     
     for model, result in test_results.items():
         if result['success']:
-            print(f"  ✅ {model}: {result['response_time']:.2f}s")
+            print(f"  ✅ {model}: {result['response_time']:.2f}s (first token {result['first_token_time']:.2f}s)")
         else:
             print(f"  ❌ {model}: {result['error']}")
     
     # Create configuration
     print("\n⚙️ Creating configuration...")
-    if setup.create_config_file():
+    if await setup.create_config_file():
         print("✅ Configuration created successfully")
     else:
         print("❌ Failed to create configuration")
@@ -420,6 +703,10 @@ async def main():
     return True
 
 if __name__ == "__main__":
+    # The loop policy must be set before asyncio.run creates the loop
+    if UVLOOP_AVAILABLE:
+        uvloop.install()
+    
     try:
         success = asyncio.run(main())
         sys.exit(0 if success else 1)
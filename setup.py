@@ -36,6 +36,12 @@ setup(
             "flake8>=6.1.0",
             "mypy>=1.7.0",
         ],
+        "performance": [
+            "numba>=0.58.0",
+            "orjson>=3.9.0",
+            "pyahocorasick>=2.0.0",
+            "uvloop>=0.19.0; sys_platform != 'win32'",
+        ],
     },
     entry_points={
         "console_scripts": [
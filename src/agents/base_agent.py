@@ -6,16 +6,101 @@ following the AI Agent Framework rules and system architecture.
 """
 
 import asyncio
+import atexit
+import contextvars
+import functools
+import heapq
+import itertools
 import logging
+import os
+import sys
+import time
+import types
 import uuid
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
-from typing import Dict, Any, List, Optional, Union
+from collections.abc import Mapping
+from typing import Callable, ClassVar, Dict, Any, Iterator, List, Optional, Tuple, Union
 from datetime import datetime
-from dataclasses import dataclass, field
+from dataclasses import InitVar, dataclass, field, fields
 
 logger = logging.getLogger(__name__)
 
+# dataclass(slots=True) needs Python 3.10+; older interpreters get regular dataclasses
+# (hand-written __slots__ can't coexist with field defaults there)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Wall-clock offset of the monotonic clock, captured once so timestamps can be
+# recorded as cheap monotonic_ns() integers and converted only when reported
+_WALL_CLOCK_OFFSET_NS = time.time_ns() - time.monotonic_ns()
+
+def _ns_to_datetime(monotonic_ns: Optional[int]) -> Optional[datetime]:
+    """Convert a monotonic_ns() reading to a local datetime."""
+    if monotonic_ns is None:
+        return None
+    return datetime.fromtimestamp((monotonic_ns + _WALL_CLOCK_OFFSET_NS) / 1e9)
+
+def _datetime_to_ns(moment: Optional[datetime]) -> Optional[int]:
+    """Convert a datetime to the monotonic_ns() scale used for stored timestamps."""
+    if moment is None:
+        return None
+    return round(moment.timestamp() * 1e9) - _WALL_CLOCK_OFFSET_NS
+
+def _datetime_alias(ns_field: str) -> property:
+    """Read/write datetime view of a *_ns timestamp field, keeping the pre-monotonic attribute API."""
+    def get(self) -> Optional[datetime]:
+        return _ns_to_datetime(getattr(self, ns_field))
+    
+    def set(self, moment: Optional[datetime]):
+        setattr(self, ns_field, _datetime_to_ns(moment))
+    
+    return property(get, set)
+
+# Random UUIDs handed out by _next_uuid(), refilled from one os.urandom() call per block
+_UUID_BLOCK_SIZE = 1024
+_uuid_pool: List[str] = []
+
+def _refill_uuid_pool():
+    """Generate the next block of version 4 UUIDs."""
+    entropy = os.urandom(16 * _UUID_BLOCK_SIZE)
+    _uuid_pool.extend(
+        str(uuid.UUID(bytes=entropy[offset:offset + 16], version=4))
+        for offset in range(0, len(entropy), 16)
+    )
+
+def _next_uuid() -> str:
+    """Return a random UUID string, equivalent to str(uuid.uuid4())."""
+    # list.pop() is atomic, so tasks built from worker threads never share an id
+    while True:
+        try:
+            return _uuid_pool.pop()
+        except IndexError:
+            _refill_uuid_pool()
+
+def create_eager_task(coro) -> asyncio.Task:
+    """
+    Schedule a coroutine as a Task that starts running immediately where supported.
+    
+    On Python 3.12+ the Task runs synchronously up to its first suspension, so
+    e.g. execute_task()'s status and stats bookkeeping happen before the caller
+    next awaits. Older interpreters get a regular Task started on the next loop
+    pass. Either way the result is an ordinary asyncio Task.
+    
+    Args:
+        coro: Coroutine to run, e.g. agent.execute_task(task)
+        
+    Returns:
+        Task wrapping the coroutine
+    """
+    loop = asyncio.get_running_loop()
+    if sys.version_info >= (3, 12):
+        return asyncio.Task(coro, loop=loop, eager_start=True)
+    return loop.create_task(coro)
+
+# Task being executed in the current execute_task() context, readable from process() and anything it calls
+current_task_var: contextvars.ContextVar[Optional['Task']] = contextvars.ContextVar('current_task', default=None)
+
 class AgentFramework(Enum):
     """Available AI agent frameworks."""
     SMOL_AGENTS = "smol_agents"
@@ -37,28 +122,45 @@ class TaskPriority(Enum):
     HIGH = 3
     CRITICAL = 4
 
-@dataclass
+@dataclass(**_SLOTS)
 class Task:
     """
     Task definition for agent processing.
     
     Represents a single unit of work that can be executed by an agent.
     """
-    task_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    task_id: str = field(default_factory=_next_uuid)
     task_type: str = ""
     description: str = ""
     parameters: Dict[str, Any] = field(default_factory=dict)
     priority: TaskPriority = TaskPriority.MEDIUM
     status: TaskStatus = TaskStatus.PENDING
-    created_at: datetime = field(default_factory=datetime.now)
-    started_at: Optional[datetime] = None
-    completed_at: Optional[datetime] = None
+    created_at_ns: int = field(default_factory=time.monotonic_ns)
+    started_at_ns: Optional[int] = None
+    completed_at_ns: Optional[int] = None
     timeout: Optional[float] = None
     retry_count: int = 0
     max_retries: int = 3
     metadata: Dict[str, Any] = field(default_factory=dict)
+    agent_name: Optional[str] = None  # Registry agent that runs the task when dispatched by TaskQueue.run()
+    # Datetime timestamps as accepted before they were stored as monotonic_ns() readings
+    created_at: InitVar[Optional[datetime]] = None
+    started_at: InitVar[Optional[datetime]] = None
+    completed_at: InitVar[Optional[datetime]] = None
+    
+    def __post_init__(self, created_at, started_at, completed_at):
+        if created_at is not None:
+            self.created_at_ns = _datetime_to_ns(created_at)
+        if started_at is not None:
+            self.started_at_ns = _datetime_to_ns(started_at)
+        if completed_at is not None:
+            self.completed_at_ns = _datetime_to_ns(completed_at)
+
+Task.created_at = _datetime_alias('created_at_ns')
+Task.started_at = _datetime_alias('started_at_ns')
+Task.completed_at = _datetime_alias('completed_at_ns')
 
-@dataclass
+@dataclass(**_SLOTS)
 class Result:
     """
     Result of agent task execution.
@@ -71,7 +173,47 @@ class Result:
     error: Optional[str] = None
     execution_time: Optional[float] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at_ns: int = field(default_factory=time.monotonic_ns)
+    created_at: InitVar[Optional[datetime]] = None
+    
+    def __post_init__(self, created_at):
+        if created_at is not None:
+            self.created_at_ns = _datetime_to_ns(created_at)
+
+Result.created_at = _datetime_alias('created_at_ns')
+
+@dataclass(**_SLOTS)
+class AgentStats(Mapping):
+    """
+    Running performance counters for an agent.
+    
+    Also a read-only mapping with the keys of the former stats dict, so
+    agent.stats['total_tasks'] keeps working.
+    """
+    total_tasks: int = 0
+    successful_tasks: int = 0
+    failed_tasks: int = 0
+    total_execution_time: float = 0.0
+    last_activity: Optional[int] = None  # monotonic_ns() of the last finished task
+    
+    @property
+    def average_execution_time(self) -> float:
+        return self.total_execution_time / self.total_tasks if self.total_tasks else 0.0
+    
+    def __getitem__(self, key: str) -> Any:
+        if key == 'last_activity':
+            return _ns_to_datetime(self.last_activity)
+        if key in _STATS_KEYS:
+            return getattr(self, key)
+        raise KeyError(key)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(_STATS_KEYS)
+    
+    def __len__(self) -> int:
+        return len(_STATS_KEYS)
+
+_STATS_KEYS = (*(stat.name for stat in fields(AgentStats)), 'average_execution_time')
 
 class BaseAgent(ABC):
     """
@@ -81,6 +223,9 @@ class BaseAgent(ABC):
     following the system architecture rules.
     """
     
+    # Worker processes shared by every agent; created on first _run_cpu() call
+    _cpu_pool: ClassVar[Optional[ProcessPoolExecutor]] = None
+    
     def __init__(
         self, 
         name: str, 
@@ -90,28 +235,41 @@ class BaseAgent(ABC):
         self.name = name
         self.description = description
         self.framework = framework
-        self.agent_id = str(uuid.uuid4())
+        self.agent_id = _next_uuid()
         
         # Performance tracking
-        self.stats = {
-            'total_tasks': 0,
-            'successful_tasks': 0,
-            'failed_tasks': 0,
-            'total_execution_time': 0.0,
-            'average_execution_time': 0.0,
-            'last_activity': None
-        }
+        self.stats = AgentStats()
         
         # State management
         self.is_initialized = False
-        self.is_running = False
-        self.current_task: Optional[Task] = None
+        # Tasks currently executing on this agent, keyed by a per-run id so the
+        # same Task object can be executed concurrently without runs clobbering each other
+        self._in_flight: Dict[int, Task] = {}
+        self._run_ids = itertools.count()
+        
+        # get_status() result, reused until _stats_version moves past _status_cache_version
+        self._stats_version = 0
+        self._status_cache: Optional[Dict[str, Any]] = None
+        self._status_cache_version = -1
         
         # Setup logging
         self.logger = logging.getLogger(f"agent.{name}")
         
         self.logger.info(f"Agent {name} created with framework {framework.value}")
     
+    @property
+    def is_running(self) -> bool:
+        """Whether any task is executing on this agent."""
+        return bool(self._in_flight)
+    
+    @property
+    def current_task(self) -> Optional[Task]:
+        """The task of the calling execute_task() context, else the most recently started one."""
+        task = current_task_var.get()
+        if task is None and self._in_flight:
+            task = next(reversed(self._in_flight.values()))
+        return task
+    
     @abstractmethod
     async def process(self, task: Task) -> Result:
         """
@@ -128,6 +286,39 @@ class BaseAgent(ABC):
         """
         pass
     
+    async def _run_cpu(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run CPU-bound work in the shared process pool without blocking the event loop.
+        
+        Use from process() for parsing or scoring so I/O-bound agents keep running.
+        func and args must be picklable (e.g. a module-level function).
+        
+        Args:
+            func: Function to call
+            *args: Positional arguments for func
+            
+        Returns:
+            func's return value
+        """
+        if BaseAgent._cpu_pool is None:
+            BaseAgent._cpu_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        return await asyncio.get_running_loop().run_in_executor(BaseAgent._cpu_pool, func, *args)
+    
+    @staticmethod
+    def shutdown_cpu_pool(wait: bool = True):
+        """
+        Shut down the shared process pool and its worker processes.
+        
+        The next _run_cpu() call starts a new pool. Runs automatically at
+        interpreter exit and from reset_agent_registry().
+        
+        Args:
+            wait: Block until pending work finishes and the workers exit
+        """
+        pool, BaseAgent._cpu_pool = BaseAgent._cpu_pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+    
     def initialize(self) -> bool:
         """
         Initialize the agent.
@@ -144,6 +335,7 @@ class BaseAgent(ABC):
             self._setup_agent()
             
             self.is_initialized = True
+            self._stats_version += 1
             self.logger.info(f"Agent {self.name} initialized successfully")
             
             return True
@@ -165,7 +357,8 @@ class BaseAgent(ABC):
         Execute a task with error handling and performance tracking.
         
         This method wraps the process() method with common functionality
-        like timing, error handling, and statistics tracking.
+        like timing, error handling, and statistics tracking. Use
+        create_eager_task() to have the bookkeeping start without a loop hop.
         
         Args:
             task: Task to execute
@@ -180,63 +373,60 @@ class BaseAgent(ABC):
                 error="Agent not initialized"
             )
         
-        start_time = datetime.now()
-        execution_start = asyncio.get_event_loop().time()
+        execution_start = time.monotonic_ns()
+        run_id = next(self._run_ids)
+        self._in_flight[run_id] = task
+        context_token = current_task_var.set(task)
         
         try:
             # Update task status
             task.status = TaskStatus.RUNNING
-            task.started_at = start_time
-            self.current_task = task
-            self.is_running = True
+            task.started_at_ns = execution_start
+            self._stats_version += 1
             
-            self.logger.info(f"Starting task {task.task_id}: {task.description}")
+            self.logger.info("Starting task %s: %s", task.task_id, task.description)
             
             # Process the task
             result = await self.process(task)
             
             # Calculate execution time
-            execution_time = asyncio.get_event_loop().time() - execution_start
+            execution_end = time.monotonic_ns()
+            execution_time = (execution_end - execution_start) * 1e-9
             result.execution_time = execution_time
             
             # Update task status
             task.status = TaskStatus.COMPLETED if result.success else TaskStatus.FAILED
-            task.completed_at = datetime.now()
+            task.completed_at_ns = execution_end
             
             # Update statistics
-            self.stats['total_tasks'] += 1
-            self.stats['total_execution_time'] += execution_time
-            self.stats['last_activity'] = datetime.now()
+            stats = self.stats
+            stats.total_tasks += 1
+            stats.total_execution_time += execution_time
+            stats.last_activity = execution_end
             
             if result.success:
-                self.stats['successful_tasks'] += 1
-                self.logger.info(f"Task {task.task_id} completed successfully in {execution_time:.2f}s")
+                stats.successful_tasks += 1
+                self.logger.info("Task %s completed successfully in %.2fs", task.task_id, execution_time)
             else:
-                self.stats['failed_tasks'] += 1
-                self.logger.warning(f"Task {task.task_id} failed: {result.error}")
-            
-            # Update average execution time
-            self.stats['average_execution_time'] = (
-                self.stats['total_execution_time'] / self.stats['total_tasks']
-            )
+                stats.failed_tasks += 1
+                self.logger.warning("Task %s failed: %s", task.task_id, result.error)
             
             return result
             
         except Exception as e:
-            execution_time = asyncio.get_event_loop().time() - execution_start
+            execution_end = time.monotonic_ns()
+            execution_time = (execution_end - execution_start) * 1e-9
             
             # Update task status
             task.status = TaskStatus.FAILED
-            task.completed_at = datetime.now()
+            task.completed_at_ns = execution_end
             
             # Update statistics
-            self.stats['total_tasks'] += 1
-            self.stats['failed_tasks'] += 1
-            self.stats['total_execution_time'] += execution_time
-            self.stats['average_execution_time'] = (
-                self.stats['total_execution_time'] / self.stats['total_tasks']
-            )
-            self.stats['last_activity'] = datetime.now()
+            stats = self.stats
+            stats.total_tasks += 1
+            stats.failed_tasks += 1
+            stats.total_execution_time += execution_time
+            stats.last_activity = execution_end
             
             error_msg = f"Task execution failed: {str(e)}"
             self.logger.error(error_msg, exc_info=True)
@@ -249,51 +439,242 @@ class BaseAgent(ABC):
             )
             
         finally:
-            self.current_task = None
-            self.is_running = False
+            del self._in_flight[run_id]
+            current_task_var.reset(context_token)
+            self._stats_version += 1
     
     def get_status(self) -> Dict[str, Any]:
         """
         Get current agent status and performance metrics.
         
+        The dictionary is cached and shared between calls until the agent's state
+        changes, so callers must not modify it.
+        
         Returns:
             Dictionary with status information
         """
+        if self._status_cache_version == self._stats_version:
+            return self._status_cache
+        
+        stats = self.stats
+        # Latest in-flight task rather than current_task, which depends on the caller's context
+        current_task = next(reversed(self._in_flight.values()), None)
         success_rate = (
-            (self.stats['successful_tasks'] / self.stats['total_tasks'] * 100)
-            if self.stats['total_tasks'] > 0 else 0
+            (stats.successful_tasks / stats.total_tasks * 100)
+            if stats.total_tasks > 0 else 0
         )
         
-        return {
+        self._status_cache = {
             'agent_id': self.agent_id,
             'agent_name': self.name,
             'description': self.description,
             'framework': self.framework.value,
             'is_initialized': self.is_initialized,
             'is_running': self.is_running,
-            'current_task': self.current_task.task_id if self.current_task else None,
+            'current_task': current_task.task_id if current_task else None,
+            'in_flight_tasks': [task.task_id for task in self._in_flight.values()],
             'performance_stats': {
-                'total_tasks': self.stats['total_tasks'],
-                'successful_tasks': self.stats['successful_tasks'],
-                'failed_tasks': self.stats['failed_tasks'],
+                'total_tasks': stats.total_tasks,
+                'successful_tasks': stats.successful_tasks,
+                'failed_tasks': stats.failed_tasks,
                 'success_rate_percent': round(success_rate, 2),
-                'average_execution_time': round(self.stats['average_execution_time'], 2),
-                'last_activity': self.stats['last_activity']
+                'average_execution_time': round(stats.average_execution_time, 2),
+                'last_activity': _ns_to_datetime(stats.last_activity)
             }
         }
+        self._status_cache_version = self._stats_version
+        return self._status_cache
     
     def reset_stats(self):
         """Reset performance statistics."""
-        self.stats = {
-            'total_tasks': 0,
-            'successful_tasks': 0,
-            'failed_tasks': 0,
-            'total_execution_time': 0.0,
-            'average_execution_time': 0.0,
-            'last_activity': None
-        }
+        self.stats = AgentStats()
+        self._stats_version += 1
         self.logger.info(f"Statistics reset for agent {self.name}")
 
+class BatchProcessAgent(BaseAgent):
+    """
+    Base class for agents whose backend accepts work in bulk.
+    
+    Concurrent execute_task() calls are coalesced into process_batch() calls of
+    up to max_batch_size tasks, waiting at most max_wait_ms for a batch to fill.
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        description: str = "",
+        framework: AgentFramework = AgentFramework.SMOL_AGENTS,
+        max_batch_size: int = 16,
+        max_wait_ms: float = 20.0
+    ):
+        super().__init__(name, description, framework)
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        
+        # Created on first use inside the running event loop
+        self._batch_queue: Optional[asyncio.Queue] = None
+        self._batcher: Optional[asyncio.Task] = None
+    
+    @abstractmethod
+    async def process_batch(self, tasks: List[Task]) -> List[Result]:
+        """
+        Process several tasks in one call.
+        
+        Args:
+            tasks: Tasks to process
+            
+        Returns:
+            One result per task, in the same order
+        """
+        pass
+    
+    async def process(self, task: Task) -> Result:
+        """Process a single task as a batch of one."""
+        return (await self.process_batch([task]))[0]
+    
+    async def execute_task(self, task: Task) -> Result:
+        """
+        Queue a task for the next batch and wait for its result.
+        
+        Args:
+            task: Task to execute
+            
+        Returns:
+            Result of task execution
+        """
+        if not self.is_initialized:
+            return Result(
+                task_id=task.task_id,
+                success=False,
+                error="Agent not initialized"
+            )
+        
+        if self._batcher is None or self._batcher.done():
+            self._batch_queue = asyncio.Queue()
+            self._batcher = asyncio.create_task(self._run_batcher())
+        
+        future = asyncio.get_running_loop().create_future()
+        self._batch_queue.put_nowait((task, future))
+        return await future
+    
+    async def close(self):
+        """Stop the background batcher, cancelling the tasks it has not finished."""
+        if self._batcher is not None and not self._batcher.done():
+            self._batcher.cancel()
+            try:
+                await self._batcher
+            except asyncio.CancelledError:
+                pass
+        self._batcher = None
+        self._batch_queue = None
+    
+    async def _run_batcher(self):
+        """Collect queued tasks into batches and execute them."""
+        loop = asyncio.get_running_loop()
+        queue = self._batch_queue
+        batch = []
+        
+        try:
+            while True:
+                batch = [await queue.get()]
+                deadline = loop.time() + self.max_wait_ms / 1000
+                
+                while len(batch) < self.max_batch_size:
+                    if not queue.empty():
+                        batch.append(queue.get_nowait())
+                        continue
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+                    except asyncio.TimeoutError:
+                        break
+                
+                await self._execute_batch(batch)
+                batch = []
+        except BaseException as e:
+            # Callers awaiting execute_task() would otherwise wait forever on these futures
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            self._abandon_batch(batch, e)
+            raise
+    
+    def _abandon_batch(self, batch: List[tuple], error: BaseException):
+        """Resolve the futures of tasks the batcher stopped before finishing."""
+        cancelled = isinstance(error, asyncio.CancelledError)
+        for task, future in batch:
+            if future.done():
+                continue
+            task.status = TaskStatus.CANCELLED if cancelled else TaskStatus.FAILED
+            if cancelled:
+                future.cancel()
+            else:
+                future.set_exception(error)
+        
+        if batch:
+            self._stats_version += 1
+            self.logger.warning("Batcher stopped with %d unfinished tasks: %r", len(batch), error)
+    
+    async def _execute_batch(self, batch: List[tuple]):
+        """Run one batch through process_batch() and resolve each caller's future."""
+        tasks = [task for task, _ in batch]
+        run_ids = [next(self._run_ids) for _ in tasks]
+        execution_start = time.monotonic_ns()
+        
+        for run_id, task in zip(run_ids, tasks):
+            task.status = TaskStatus.RUNNING
+            task.started_at_ns = execution_start
+            self._in_flight[run_id] = task
+        self._stats_version += 1
+        
+        self.logger.info("Starting batch of %d tasks", len(tasks))
+        
+        try:
+            results = await self.process_batch(tasks)
+            if len(results) != len(tasks):
+                raise ValueError(f"process_batch returned {len(results)} results for {len(tasks)} tasks")
+        except Exception as e:
+            error_msg = f"Task execution failed: {str(e)}"
+            self.logger.error(error_msg, exc_info=True)
+            results = [Result(task_id=task.task_id, success=False, error=error_msg) for task in tasks]
+        finally:
+            for run_id in run_ids:
+                del self._in_flight[run_id]
+        
+        # Every task in the batch shares the batch's wall time
+        execution_end = time.monotonic_ns()
+        execution_time = (execution_end - execution_start) * 1e-9
+        stats = self.stats
+        
+        for (task, future), result in zip(batch, results):
+            result.execution_time = execution_time
+            task.status = TaskStatus.COMPLETED if result.success else TaskStatus.FAILED
+            task.completed_at_ns = execution_end
+            
+            stats.total_tasks += 1
+            stats.total_execution_time += execution_time
+            if result.success:
+                stats.successful_tasks += 1
+            else:
+                stats.failed_tasks += 1
+                self.logger.warning("Task %s failed: %s", task.task_id, result.error)
+            
+            if not future.done():
+                future.set_result(result)
+        
+        stats.last_activity = execution_end
+        self._stats_version += 1
+        self.logger.info("Batch of %d tasks completed in %.2fs", len(tasks), execution_time)
+
+@functools.lru_cache(maxsize=256)
+def _missing_agent_result(agent_name: str) -> types.MappingProxyType:
+    """Read-only Result fields for a task sent to an unregistered agent."""
+    return types.MappingProxyType({
+        'success': False,
+        'error': f"Agent {agent_name} not found"
+    })
+
 class AgentRegistry:
     """
     Registry for managing multiple agents.
@@ -304,6 +685,20 @@ class AgentRegistry:
     def __init__(self):
         self._agents: Dict[str, BaseAgent] = {}
         self.logger = logging.getLogger("agent_registry")
+        
+        # get_agent_status() aggregate, reused while membership and every agent's _stats_version are unchanged
+        self._membership_version = 0
+        self._agg_cache: Optional[Dict[str, Any]] = None
+        self._agg_cache_key: Optional[Tuple[int, int]] = None
+        # Agents overriding get_status() aren't covered by _stats_version, so their presence disables the cache
+        self._agg_cacheable = True
+    
+    def _membership_changed(self):
+        """Invalidate the status aggregate after an agent is added or removed."""
+        self._membership_version += 1
+        self._agg_cacheable = all(
+            type(agent).get_status is BaseAgent.get_status for agent in self._agents.values()
+        )
     
     def register(self, agent: BaseAgent) -> bool:
         """
@@ -317,15 +712,16 @@ class AgentRegistry:
         """
         try:
             if agent.name in self._agents:
-                self.logger.warning(f"Agent {agent.name} already registered, replacing")
+                self.logger.warning("Agent %s already registered, replacing", agent.name)
             
             self._agents[agent.name] = agent
-            self.logger.info(f"Agent {agent.name} registered successfully")
+            self._membership_changed()
+            self.logger.info("Agent %s registered successfully", agent.name)
             
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to register agent {agent.name}: {e}")
+            self.logger.error("Failed to register agent %s: %s", agent.name, e)
             return False
     
     def unregister(self, agent_name: str) -> bool:
@@ -341,14 +737,15 @@ class AgentRegistry:
         try:
             if agent_name in self._agents:
                 del self._agents[agent_name]
-                self.logger.info(f"Agent {agent_name} unregistered")
+                self._membership_changed()
+                self.logger.info("Agent %s unregistered", agent_name)
                 return True
             else:
-                self.logger.warning(f"Agent {agent_name} not found for unregistration")
+                self.logger.warning("Agent %s not found for unregistration", agent_name)
                 return False
                 
         except Exception as e:
-            self.logger.error(f"Failed to unregister agent {agent_name}: {e}")
+            self.logger.error("Failed to unregister agent %s: %s", agent_name, e)
             return False
     
     def get_agent(self, agent_name: str) -> Optional[BaseAgent]:
@@ -363,6 +760,13 @@ class AgentRegistry:
         """
         return self._agents.get(agent_name)
     
+    def _resolve(self, agent_name: str) -> Tuple[Optional[BaseAgent], Optional[types.MappingProxyType]]:
+        """Look an agent up once, returning it or the cached missing-agent Result fields."""
+        agent = self._agents.get(agent_name)
+        if agent is None:
+            return None, _missing_agent_result(agent_name)
+        return agent, None
+    
     def list_agents(self) -> List[str]:
         """
         List all registered agent names.
@@ -376,6 +780,10 @@ class AgentRegistry:
         """
         Get status of one or all agents.
         
+        The all-agents dictionary is cached and shared between calls until an
+        agent's state or the registry's membership changes, so callers must not
+        modify it.
+        
         Args:
             agent_name: Specific agent name, or None for all agents
             
@@ -383,16 +791,22 @@ class AgentRegistry:
             Status information
         """
         if agent_name:
-            agent = self._agents.get(agent_name)
-            if agent:
-                return agent.get_status()
-            else:
-                return {'error': f'Agent {agent_name} not found'}
-        else:
-            return {
-                'total_agents': len(self._agents),
-                'agents': {name: agent.get_status() for name, agent in self._agents.items()}
-            }
+            agent, missing = self._resolve(agent_name)
+            if agent is None:
+                return {'error': missing['error']}
+            return agent.get_status()
+        
+        agents = self._agents
+        key = (self._membership_version, sum(agent._stats_version for agent in agents.values()))
+        if self._agg_cacheable and key == self._agg_cache_key:
+            return self._agg_cache
+        
+        self._agg_cache = {
+            'total_agents': len(agents),
+            'agents': {name: agent.get_status() for name, agent in agents.items()}
+        }
+        self._agg_cache_key = key
+        return self._agg_cache
     
     async def execute_task(self, agent_name: str, task: Task) -> Result:
         """
@@ -405,14 +819,9 @@ class AgentRegistry:
         Returns:
             Result of task execution
         """
-        agent = self._agents.get(agent_name)
-        
-        if not agent:
-            return Result(
-                task_id=task.task_id,
-                success=False,
-                error=f"Agent {agent_name} not found"
-            )
+        agent, missing = self._resolve(agent_name)
+        if agent is None:
+            return Result(task_id=task.task_id, **missing)
         
         return await agent.execute_task(task)
 
@@ -432,9 +841,12 @@ def get_agent_registry() -> AgentRegistry:
     return _global_registry
 
 def reset_agent_registry():
-    """Reset the global agent registry."""
+    """Reset the global agent registry and release the shared process pool."""
     global _global_registry
     _global_registry = AgentRegistry()
+    BaseAgent.shutdown_cpu_pool()
+
+atexit.register(BaseAgent.shutdown_cpu_pool)
 
 class TaskQueue:
     """
@@ -445,10 +857,15 @@ class TaskQueue:
     
     def __init__(self, max_concurrent_tasks: int = 5):
         self.max_concurrent_tasks = max_concurrent_tasks
-        self._pending_tasks: List[Task] = []
+        # Min-heap of (-priority, insertion order, task): highest priority first, FIFO within a priority
+        self._pending_tasks: List[Tuple[int, int, Task]] = []
+        self._sequence = itertools.count()
         self._running_tasks: Dict[str, Task] = {}
         self._completed_tasks: Dict[str, Result] = {}
         self.logger = logging.getLogger("task_queue")
+        
+        # Wakes idle workers when a task is added or a slot frees up; bound to the loop in run()
+        self._wakeup: Optional[asyncio.Event] = None
     
     def add_task(self, task: Task) -> bool:
         """
@@ -462,21 +879,15 @@ class TaskQueue:
         """
         try:
             # Insert task in priority order
-            inserted = False
-            for i, existing_task in enumerate(self._pending_tasks):
-                if task.priority.value > existing_task.priority.value:
-                    self._pending_tasks.insert(i, task)
-                    inserted = True
-                    break
+            heapq.heappush(self._pending_tasks, (-task.priority.value, next(self._sequence), task))
+            if self._wakeup is not None:
+                self._wakeup.set()
             
-            if not inserted:
-                self._pending_tasks.append(task)
-            
-            self.logger.info(f"Task {task.task_id} added to queue (priority: {task.priority.name})")
+            self.logger.info("Task %s added to queue (priority: %s)", task.task_id, task.priority.name)
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to add task {task.task_id}: {e}")
+            self.logger.error("Failed to add task %s: %s", task.task_id, e)
             return False
     
     def get_next_task(self) -> Optional[Task]:
@@ -490,7 +901,7 @@ class TaskQueue:
             return None
         
         if self._pending_tasks:
-            task = self._pending_tasks.pop(0)
+            task = heapq.heappop(self._pending_tasks)[2]
             self._running_tasks[task.task_id] = task
             return task
         
@@ -507,7 +918,64 @@ class TaskQueue:
         if task_id in self._running_tasks:
             del self._running_tasks[task_id]
             self._completed_tasks[task_id] = result
-            self.logger.info(f"Task {task_id} completed")
+            self.logger.info("Task %s completed", task_id)
+            if self._wakeup is not None:
+                self._wakeup.set()
+    
+    async def run(self, registry: Optional[AgentRegistry] = None, until_empty: bool = False):
+        """
+        Dispatch queued tasks to their agents with a pool of worker coroutines.
+        
+        Idle workers sleep until add_task() or complete_task() wakes them instead
+        of polling get_next_task().
+        
+        Args:
+            registry: Registry resolving each task's agent_name (global registry if omitted)
+            until_empty: Return once no tasks are pending or running; otherwise run until cancelled
+        """
+        registry = registry or get_agent_registry()
+        self._wakeup = asyncio.Event()
+        workers = [
+            asyncio.ensure_future(self._worker(registry, until_empty))
+            for _ in range(self.max_concurrent_tasks)
+        ]
+        
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            # Stop every sibling before dropping the event they wait on, whether run()
+            # was cancelled or one worker failed
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            self._wakeup = None
+    
+    async def _worker(self, registry: AgentRegistry, until_empty: bool):
+        """Take the next task whenever a slot is free and record its result."""
+        while True:
+            task = self.get_next_task()
+            if task is None:
+                if until_empty and not self._pending_tasks and not self._running_tasks:
+                    # Wake the other idle workers so they can exit too
+                    self._wakeup.set()
+                    return
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            
+            result = None
+            try:
+                # Started eagerly so the task is marked running as soon as it leaves the queue
+                result = await create_eager_task(registry.execute_task(task.agent_name, task))
+            except Exception as e:
+                self.logger.error("Task %s failed in the queue: %s", task.task_id, e)
+                result = Result(task_id=task.task_id, success=False, error=f"Task execution failed: {e}")
+            finally:
+                if result is None:
+                    # Cancelled mid-task; free the slot so the queue is not left wedged
+                    task.status = TaskStatus.CANCELLED
+                    result = Result(task_id=task.task_id, success=False, error="Task cancelled")
+                self.complete_task(task.task_id, result)
     
     def get_queue_status(self) -> Dict[str, Any]:
         """
@@ -522,7 +990,7 @@ class TaskQueue:
             'completed_tasks': len(self._completed_tasks),
             'max_concurrent_tasks': self.max_concurrent_tasks,
             'next_task_priority': (
-                self._pending_tasks[0].priority.name 
+                self._pending_tasks[0][2].priority.name 
                 if self._pending_tasks else None
             )
         } 
\ No newline at end of file
@@ -9,13 +9,24 @@ import csv
 import os
 import logging
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# Filename slug normalization: separators become underscores, commas are dropped
+_SLUG_TABLE = str.maketrans({' ': '_', '/': '_', ',': ''})
+
 class CSVGenerator:
     """Generator for CRM-optimized CSV files."""
     
+    # CRM fields filled from a legacy scraper field when not found directly
+    FIELD_FALLBACKS = {
+        'headquarters_address': 'address',
+        'phone_main': 'phone_number',
+        'website_url': 'website',
+        'industry_primary': 'industry'
+    }
+    
     def __init__(self):
         """Initialize CSV generator."""
         self.output_dir = os.path.join('data', 'outputs')
@@ -42,7 +53,8 @@ class CSVGenerator:
         """
         try:
             # Generate filename
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            now = datetime.now()
+            timestamp = now.strftime('%Y%m%d_%H%M%S')
             query_slug = self._slugify(query)
             location_slug = self._slugify(location)
             
@@ -52,13 +64,19 @@ class CSVGenerator:
             # Define comprehensive field set
             fieldnames = self._get_comprehensive_fieldnames()
             
+            # Metadata defaults are shared by every row of this file
+            collection_date = now.strftime('%Y-%m-%d')
+            last_updated = now.strftime('%Y-%m-%d %H:%M:%S')
+            
             # Write CSV file
             with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
                 writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
                 writer.writeheader()
                 
                 for business in data:
-                    row = self._prepare_csv_row(business, fieldnames)
+                    row = self._prepare_csv_row(
+                        business, fieldnames, collection_date, last_updated
+                    )
                     writer.writerow(row)
             
             logger.info(f"Generated CSV file: {filepath} with {len(data)} records")
@@ -119,42 +137,49 @@ class CSVGenerator:
             'budget_indicators', 'authority_level', 'need_urgency'
         ]
     
-    def _prepare_csv_row(self, business: Dict[str, Any], fieldnames: List[str]) -> Dict[str, Any]:
+    def _prepare_csv_row(
+        self,
+        business: Dict[str, Any],
+        fieldnames: List[str],
+        collection_date: Optional[str] = None,
+        last_updated: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Prepare a business record for CSV output.
         
         Args:
             business: Business data dictionary
             fieldnames: List of expected field names
+            collection_date: Default collection date (defaults to today)
+            last_updated: Default last-updated timestamp (defaults to now)
             
         Returns:
             CSV-ready row dictionary
         """
-        row = {}
-        
-        for field in fieldnames:
-            value = business.get(field, 'NOT_FOUND')
-            
-            # Handle special field mappings
-            if field == 'headquarters_address' and value == 'NOT_FOUND':
-                value = business.get('address', 'NOT_FOUND')
-            elif field == 'phone_main' and value == 'NOT_FOUND':
-                value = business.get('phone_number', 'NOT_FOUND')
-            elif field == 'website_url' and value == 'NOT_FOUND':
-                value = business.get('website', 'NOT_FOUND')
-            elif field == 'industry_primary' and value == 'NOT_FOUND':
-                value = business.get('industry', 'NOT_FOUND')
-            elif field == 'collection_date' and value == 'NOT_FOUND':
-                value = datetime.now().strftime('%Y-%m-%d')
-            elif field == 'last_updated' and value == 'NOT_FOUND':
-                value = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            elif field == 'verification_status' and value == 'NOT_FOUND':
-                value = 'auto_extracted'
-            
-            # Clean and standardize the value
-            row[field] = self._clean_field_value(value, field)
-        
-        return row
+        if collection_date is None or last_updated is None:
+            now = datetime.now()
+            collection_date = collection_date or now.strftime('%Y-%m-%d')
+            last_updated = last_updated or now.strftime('%Y-%m-%d %H:%M:%S')
+        
+        # Missing fields default to NOT_FOUND in one C-level dict merge
+        values = {**dict.fromkeys(fieldnames, 'NOT_FOUND'), **business}
+        
+        # Handle special field mappings
+        for field, source_field in self.FIELD_FALLBACKS.items():
+            if values.get(field) == 'NOT_FOUND':
+                values[field] = business.get(source_field, 'NOT_FOUND')
+        
+        metadata_defaults = {
+            'collection_date': collection_date,
+            'last_updated': last_updated,
+            'verification_status': 'auto_extracted'
+        }
+        for field, default in metadata_defaults.items():
+            if values.get(field) == 'NOT_FOUND':
+                values[field] = default
+        
+        # Clean and standardize the values
+        return {field: self._clean_field_value(values[field], field) for field in fieldnames}
     
     def _clean_field_value(self, value: Any, field_name: str) -> str:
         """
@@ -236,7 +261,7 @@ class CSVGenerator:
             return 'unknown'
         
         # Replace spaces and special characters
-        slug = text.lower().replace(' ', '_').replace('/', '_').replace(',', '')
+        slug = text.lower().translate(_SLUG_TABLE)
         
         # Remove any remaining problematic characters
         safe_chars = 'abcdefghijklmnopqrstuvwxyz0123456789_-'
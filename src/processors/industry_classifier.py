@@ -9,6 +9,9 @@ import re
 import logging
 from typing import Dict, Any, List, Tuple
 
+import numpy as np
+import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 class IndustryClassifier:
@@ -61,6 +64,78 @@ class IndustryClassifier:
         
         return classification
     
+    def classify_batch(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Classify a batch of businesses into industry categories.
+        
+        Applies the same keyword scoring as classify, but evaluates each
+        pattern once over the whole column of business texts.
+        
+        Args:
+            df: Business data, one record per row
+            
+        Returns:
+            Classification columns aligned to the input index
+        """
+        try:
+            def text_column(field: str) -> pd.Series:
+                if field not in df.columns:
+                    return pd.Series('', index=df.index)
+                return df[field].where(df[field].notna(), '').astype(str)
+            
+            # Combine text for analysis
+            combined_text = (
+                text_column('business_name') + ' ' +
+                text_column('business_description') + ' ' +
+                text_column('industry')
+            ).str.lower()
+            
+            # Raw and pattern-normalized keyword scores, one column per industry
+            industries = list(self.keyword_patterns)
+            raw_scores = np.zeros((len(df), len(industries)))
+            normalized_scores = np.zeros((len(df), len(industries)))
+            for position, patterns in enumerate(self.keyword_patterns.values()):
+                for pattern, weight in patterns:
+                    matched = combined_text.str.contains(pattern, case=False, regex=True).to_numpy(dtype=bool)
+                    raw_scores[:, position] += weight * matched
+                normalized_scores[:, position] = raw_scores[:, position] / len(patterns)
+            
+            # Highest normalized score wins; ties go to the first industry listed
+            best_positions = normalized_scores.argmax(axis=1)
+            highest_scores = normalized_scores.max(axis=1)
+            matched_any = highest_scores > 0
+            
+            primary = np.where(matched_any, np.array(industries, dtype=object)[best_positions], 'Unknown')
+            classification = pd.DataFrame({'industry_primary': primary}, index=df.index)
+            classification['naics_code'] = [
+                self.naics_mapping.get(industry, {}).get('code', 'UNKNOWN') for industry in primary
+            ]
+            classification['industry_confidence'] = np.where(
+                matched_any, np.minimum(10, (highest_scores * 10).astype(int)), 1
+            )
+            classification['industry_category'] = [
+                self._get_industry_category(industry) for industry in primary
+            ]
+            classification['classification_method'] = 'keyword_matching'
+            
+            # Add secondary classifications if applicable
+            secondary_mask = raw_scores >= 2
+            secondary_mask[np.arange(len(df)), best_positions] &= ~matched_any
+            secondary = [
+                ', '.join([industries[i] for i in np.flatnonzero(row)][:3]) or None
+                for row in secondary_mask
+            ]
+            classification['industry_secondary'] = pd.Series(secondary, index=df.index, dtype=object)
+            
+            return classification
+            
+        except Exception as e:
+            logger.error(f"Error batch classifying industries, falling back to per-record classification: {e}")
+            return pd.DataFrame(
+                [self.classify(record) for record in df.to_dict('records')],
+                index=df.index
+            )
+    
     def _classify_by_keywords(self, text: str) -> Tuple[str, str, int]:
         """
         Classify industry based on keyword matching.
@@ -6,13 +6,14 @@ from various sources including business directories, government databases,
 and professional networks.
 """
 
-from .base_scraper import BaseScraper
+from .base_scraper import BaseScraper, create_session
 from .isp_scraper import ISPScraper
 from .directory_scrapers import YellowPagesScraper, GoogleBusinessScraper
 from .contact_scraper import ContactScraper
 
 __all__ = [
     'BaseScraper',
+    'create_session',
     'ISPScraper', 
     'YellowPagesScraper',
     'GoogleBusinessScraper',
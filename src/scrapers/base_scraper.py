@@ -6,6 +6,8 @@ Provides common functionality for rate limiting, session management, and error h
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+import threading
 import time
 import logging
 from abc import ABC, abstractmethod
@@ -14,33 +16,58 @@ from urllib.parse import urljoin, urlparse
 
 logger = logging.getLogger(__name__)
 
+def create_session(pool_connections: int = 10, pool_maxsize: int = 20) -> requests.Session:
+    """
+    Create a keep-alive HTTP session with a pooled connection adapter.
+    
+    Args:
+        pool_connections: Number of per-host connection pools to cache
+        pool_maxsize: Maximum connections kept open per host
+        
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    })
+    return session
+
 class BaseScraper(ABC):
     """Abstract base class for all web scrapers."""
     
-    def __init__(self, rate_limit_delay: float = 2.0):
+    def __init__(self, rate_limit_delay: float = 2.0, session: Optional[requests.Session] = None):
         """
         Initialize base scraper.
         
         Args:
             rate_limit_delay: Delay between requests in seconds
+            session: Shared HTTP session to reuse connections across scrapers
         """
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        self.session = session or create_session()
         self.rate_limit_delay = rate_limit_delay
         self.last_request_time = 0
+        # Scrapers are shared by concurrent requests, so last_request_time is only touched under this lock
+        self._rate_limit_lock = threading.Lock()
         
     def _rate_limit(self):
-        """Implement rate limiting between requests."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
+        """
+        Implement rate limiting between requests.
         
-        if time_since_last < self.rate_limit_delay:
-            sleep_time = self.rate_limit_delay - time_since_last
-            time.sleep(sleep_time)
+        Thread-safe: each caller reserves the next free request slot under the
+        lock and then sleeps until it outside the lock.
+        """
+        with self._rate_limit_lock:
+            current_time = time.time()
+            request_time = max(current_time, self.last_request_time + self.rate_limit_delay)
+            self.last_request_time = request_time
         
-        self.last_request_time = time.time()
+        sleep_time = request_time - current_time
+        if sleep_time > 0:
+            time.sleep(sleep_time)
     
     def _make_request(self, url: str, **kwargs) -> Optional[requests.Response]:
         """
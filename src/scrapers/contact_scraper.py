@@ -7,6 +7,7 @@ from company websites, LinkedIn profiles, and other sources.
 
 import re
 import logging
+import requests
 from typing import Dict, Any, List, Optional
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
@@ -17,9 +18,9 @@ logger = logging.getLogger(__name__)
 class ContactScraper(BaseScraper):
     """Specialized scraper for extracting leadership and contact information."""
     
-    def __init__(self, rate_limit_delay: float = 3.0):
+    def __init__(self, rate_limit_delay: float = 3.0, session: Optional[requests.Session] = None):
         """Initialize contact scraper with longer delays for respectful crawling."""
-        super().__init__(rate_limit_delay)
+        super().__init__(rate_limit_delay, session)
         
     def scrape(self, query: str, location: str = None, **kwargs) -> List[Dict[str, Any]]:
         """Not used directly - this scraper enhances existing business data."""
@@ -7,6 +7,7 @@ online business databases with enhanced web crawling capabilities.
 
 import re
 import logging
+import requests
 from typing import Dict, Any, List, Optional
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, quote_plus
@@ -18,10 +19,10 @@ logger = logging.getLogger(__name__)
 class YellowPagesScraper(BaseScraper):
     """Enhanced Yellow Pages scraper with deep web crawling."""
     
-    def __init__(self, rate_limit_delay: float = 2.5):
+    def __init__(self, rate_limit_delay: float = 2.5, session: Optional[requests.Session] = None):
         """Initialize with contact enhancement capabilities."""
-        super().__init__(rate_limit_delay)
-        self.contact_scraper = ContactScraper(rate_limit_delay + 1.0)
+        super().__init__(rate_limit_delay, session)
+        self.contact_scraper = ContactScraper(rate_limit_delay + 1.0, self.session)
         
     def scrape(self, query: str, location: str = None, **kwargs) -> List[Dict[str, Any]]:
         """
@@ -7,6 +7,7 @@ Includes enhanced contact information extraction for CEO names, emails, and key
 
 import re
 import logging
+import requests
 from typing import Dict, Any, List, Optional
 from bs4 import BeautifulSoup
 from .base_scraper import BaseScraper
@@ -17,10 +18,10 @@ logger = logging.getLogger(__name__)
 class ISPScraper(BaseScraper):
     """Specialized scraper for Internet Service Providers."""
     
-    def __init__(self, rate_limit_delay: float = 2.0):
+    def __init__(self, rate_limit_delay: float = 2.0, session: Optional[requests.Session] = None):
         """Initialize ISP scraper with contact extraction capabilities."""
-        super().__init__(rate_limit_delay)
-        self.contact_scraper = ContactScraper(rate_limit_delay)
+        super().__init__(rate_limit_delay, session)
+        self.contact_scraper = ContactScraper(rate_limit_delay, self.session)
         
     def scrape(self, query: str, location: str = None, **kwargs) -> List[Dict[str, Any]]:
         """
@@ -30,10 +30,30 @@ try:
 except ImportError:
     LANGCHAIN_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from ..config.settings import get_config
 
 logger = logging.getLogger(__name__)
 
+
+def _dumps_results(results: List[Dict[str, Any]]) -> str:
+    """Serialize scraped results to indented JSON, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(results, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(results, indent=2)
+
+
+def _loads_params(input_str: str) -> Dict[str, Any]:
+    """Parse JSON tool input, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(input_str)
+    return json.loads(input_str)
+
 class WebScraperTool:
     """
     Web scraper tool for collecting business data from multiple sources.
@@ -425,7 +445,7 @@ class WebScraperTool:
                     results = loop.run_until_complete(
                         self.scraper.scrape(source, search_terms, location, max_results)
                     )
-                    return json.dumps(results, indent=2)
+                    return _dumps_results(results)
                 finally:
                     loop.close()
         
@@ -440,7 +460,7 @@ class WebScraperTool:
             """Wrapper function for LangChain tool."""
             try:
                 # Parse input (expecting JSON format)
-                params = json.loads(input_str)
+                params = _loads_params(input_str)
                 source = params.get('source', 'yellow_pages')
                 search_terms = params.get('search_terms', '')
                 location = params.get('location', '')
@@ -453,7 +473,7 @@ class WebScraperTool:
                     results = loop.run_until_complete(
                         self.scrape(source, search_terms, location, max_results)
                     )
-                    return json.dumps(results, indent=2)
+                    return _dumps_results(results)
                 finally:
                     loop.close()
                     
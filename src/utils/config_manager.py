@@ -199,6 +199,38 @@ class ConfigurationManager:
         """
         Test API connection for a specific provider.
         
+        Args:
+            provider: 'openai' or 'anthropic'
+            
+        Returns:
+            Test result
+        """
+        try:
+            import asyncio
+            from .http_client import close_session
+            
+            async def test_connection():
+                try:
+                    return await self.test_api_connection_async(provider)
+                finally:
+                    await close_session()
+            
+            # Run the async test
+            return asyncio.run(test_connection())
+            
+        except Exception as e:
+            logger.error(f"{provider} API test error: {e}")
+            return {
+                'success': False,
+                'provider': provider,
+                'message': f"{provider.title()} API test error: {str(e)}",
+                'response_time': 0
+            }
+    
+    async def test_api_connection_async(self, provider: str) -> Dict[str, Any]:
+        """
+        Test API connection for a specific provider using the shared HTTP session.
+        
         Args:
             provider: 'openai' or 'anthropic'
             
@@ -213,33 +245,29 @@ class ConfigurationManager:
         }
         
         try:
-            import asyncio
-            from ..utils.local_llm_client import LocalLLMClient
+            from .http_client import get_session
+            from .local_llm_client import LocalLLMClient
             
-            async def test_connection():
-                client = LocalLLMClient()
-                test_prompt = "Hello, this is a test. Please respond with 'API connection successful'."
-                
-                start_time = datetime.now()
-                response = await client._call_cloud_api(test_prompt, provider)
-                end_time = datetime.now()
-                
-                await client.close()
-                
-                result['response_time'] = (end_time - start_time).total_seconds()
-                
-                if response['success']:
-                    result['success'] = True
-                    result['message'] = f"{provider.title()} API connection successful"
-                    logger.info(f"{provider} API test successful")
-                else:
-                    result['message'] = f"{provider.title()} API test failed: {response.get('error', 'Unknown error')}"
-                    logger.warning(f"{provider} API test failed")
-                
-                return result
+            client = LocalLLMClient(session=await get_session())
+            test_prompt = "Hello, this is a test. Please respond with 'API connection successful'."
             
-            # Run the async test
-            return asyncio.run(test_connection())
+            start_time = datetime.now()
+            response = await client._call_cloud_api(test_prompt, provider)
+            end_time = datetime.now()
+            
+            await client.close()
+            
+            result['response_time'] = (end_time - start_time).total_seconds()
+            
+            if response['success']:
+                result['success'] = True
+                result['message'] = f"{provider.title()} API connection successful"
+                logger.info(f"{provider} API test successful")
+            else:
+                result['message'] = f"{provider.title()} API test failed: {response.get('error', 'Unknown error')}"
+                logger.warning(f"{provider} API test failed")
+            
+            return result
             
         except Exception as e:
             result['message'] = f"{provider.title()} API test error: {str(e)}"
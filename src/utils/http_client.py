@@ -0,0 +1,63 @@
+"""
+Shared HTTP Client
+
+Provides a pooled aiohttp session that is reused across health probes,
+API connection tests and crawl traffic so TCP/TLS handshakes are amortized.
+"""
+
+import asyncio
+import atexit
+import logging
+import weakref
+from typing import Optional
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
+# aiohttp sessions are bound to the event loop that created them, so keep one per loop
+_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = weakref.WeakKeyDictionary()
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """
+    Get the shared session for the running event loop, creating it on first use.
+
+    Returns:
+        Pooled aiohttp ClientSession
+    """
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(limit=100, limit_per_host=10, enable_cleanup_closed=True)
+        session = aiohttp.ClientSession(connector=connector, timeout=DEFAULT_TIMEOUT)
+        _sessions[loop] = session
+    return session
+
+
+async def close_session(loop: Optional[asyncio.AbstractEventLoop] = None):
+    """Close the shared session bound to the given (or running) event loop."""
+    loop = loop or asyncio.get_running_loop()
+    session = _sessions.pop(loop, None)
+    if session is not None and not session.closed:
+        await session.close()
+        logger.debug("Shared HTTP session closed")
+
+
+def _close_all_sessions():
+    """Close any sessions still open at interpreter shutdown."""
+    for loop in list(_sessions.keys()):
+        try:
+            if loop.is_closed():
+                _sessions.pop(loop, None)
+            elif loop.is_running():
+                asyncio.run_coroutine_threadsafe(close_session(loop), loop).result(timeout=5)
+            else:
+                loop.run_until_complete(close_session(loop))
+        except Exception as e:
+            logger.debug(f"Error closing shared HTTP session: {e}")
+
+
+atexit.register(_close_all_sessions)
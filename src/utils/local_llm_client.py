@@ -32,7 +32,7 @@ class LocalLLMClient:
     with automatic fallback to cloud APIs when local models fail.
     """
     
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
         self.config = get_config()
         
         # Handle both pydantic and dict config formats
@@ -62,8 +62,9 @@ class LocalLLMClient:
             'last_cloud_fallback': None
         }
         
-        # Session for HTTP requests
-        self.session: Optional[aiohttp.ClientSession] = None
+        # Session for HTTP requests (a shared session passed in is not closed by this client)
+        self.session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
         
         platform = getattr(self.llm_config, 'platform', 'ollama') if hasattr(self.llm_config, 'platform') else 'ollama'
         logger.info(f"LocalLLMClient initialized - Platform: {platform}")
@@ -71,6 +72,7 @@ class LocalLLMClient:
     async def _ensure_session(self):
         """Ensure HTTP session is available."""
         if self.session is None or self.session.closed:
+            self._owns_session = True
             max_response_time = getattr(self.llm_config, 'max_response_time', 30.0) if hasattr(self.llm_config, 'max_response_time') else 30.0
             timeout = aiohttp.ClientTimeout(total=max_response_time)
             self.session = aiohttp.ClientSession(timeout=timeout)
@@ -585,7 +587,7 @@ Format your response as JSON:
     
     async def close(self):
         """Clean up resources."""
-        if self.session and not self.session.closed:
+        if self._owns_session and self.session and not self.session.closed:
             await self.session.close()
         
         logger.info("LocalLLMClient session closed") 
\ No newline at end of file
@@ -0,0 +1,61 @@
+"""
+Ollama Status Cache
+
+Persists the last Ollama availability probe so repeated checks within a short
+window reuse the result instead of issuing another HTTP request.
+"""
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+OLLAMA_STATUS_CACHE = Path('data/cache/ollama_status.json')
+OLLAMA_STATUS_TTL = 30.0
+
+
+def read_cached_status(ttl: float = OLLAMA_STATUS_TTL) -> Optional[bool]:
+    """
+    Read the cached probe result.
+
+    Args:
+        ttl: Maximum age of the cached result in seconds
+
+    Returns:
+        Cached availability, or None if missing, unreadable or expired
+    """
+    try:
+        with open(OLLAMA_STATUS_CACHE, 'r') as f:
+            cached = json.load(f)
+        if time.time() - cached['ts'] < ttl:
+            return bool(cached['ok'])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def write_cached_status(ok: bool):
+    """Atomically persist a probe result."""
+    try:
+        OLLAMA_STATUS_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = OLLAMA_STATUS_CACHE.with_suffix('.json.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump({'ts': time.time(), 'ok': bool(ok)}, f)
+        os.replace(tmp_path, OLLAMA_STATUS_CACHE)
+    except OSError as e:
+        logger.debug(f"Could not write Ollama status cache: {e}")
+
+
+def invalidate_ollama_cache():
+    """Drop the cached result so the next check probes Ollama again."""
+    try:
+        OLLAMA_STATUS_CACHE.unlink()
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.debug(f"Could not remove Ollama status cache: {e}")
+
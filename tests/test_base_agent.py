@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""
+Tests for the base agent framework.
+
+Covers task execution bookkeeping, cancellation, scheduling helpers, the
+priority task queue, and the registry status caches.
+"""
+
+import asyncio
+import inspect
+import logging
+from datetime import datetime
+
+import pytest
+
+from src.agents.base_agent import (
+    AgentRegistry, BaseAgent, BatchProcessAgent, Result, Task, TaskPriority,
+    TaskQueue, TaskStatus, create_eager_task, current_task_var, reset_agent_registry
+)
+
+logging.basicConfig(level=logging.INFO)
+
+class EchoAgent(BaseAgent):
+    """Agent that waits for `delay` seconds and echoes the task id."""
+
+    def __init__(self, name: str = "echo", delay: float = 0.01):
+        super().__init__(name)
+        self.delay = delay
+
+    async def process(self, task: Task) -> Result:
+        await asyncio.sleep(self.delay)
+        return Result(task_id=task.task_id, success=True, data=task.task_id)
+
+def _make_agent(**kwargs) -> EchoAgent:
+    agent = EchoAgent(**kwargs)
+    assert agent.initialize()
+    return agent
+
+def test_execute_task_is_coroutine_function():
+    """execute_task stays a plain coroutine function so create_task() accepts it."""
+    assert inspect.iscoroutinefunction(BaseAgent.execute_task)
+
+def test_execute_task_with_create_task():
+    """Tasks scheduled with asyncio.create_task() run and record stats."""
+    async def run():
+        agent = _make_agent()
+        tasks = [asyncio.create_task(agent.execute_task(Task(task_id=str(i)))) for i in range(3)]
+        results = await asyncio.gather(*tasks)
+        assert [result.data for result in results] == ['0', '1', '2']
+        assert agent.get_status()['performance_stats']['total_tasks'] == 3
+        assert not agent.is_running
+
+    asyncio.run(run())
+
+def test_create_eager_task():
+    """create_eager_task() returns a regular Task with the usual result."""
+    async def run():
+        agent = _make_agent()
+        task = Task()
+        scheduled = create_eager_task(agent.execute_task(task))
+        assert isinstance(scheduled, asyncio.Task)
+        result = await scheduled
+        assert result.success and task.status == TaskStatus.COMPLETED
+
+    asyncio.run(run())
+
+def test_cancel_before_start_leaves_agent_idle():
+    """Cancelling a scheduled task before its first step leaves no in-flight state."""
+    async def run():
+        agent = _make_agent()
+        scheduled = asyncio.create_task(agent.execute_task(Task()))
+        scheduled.cancel()
+        try:
+            await scheduled
+        except asyncio.CancelledError:
+            pass
+        assert not agent.is_running
+        assert agent.current_task is None
+
+    asyncio.run(run())
+
+def test_cancel_during_process_leaves_agent_idle():
+    """Cancelling mid-process clears the in-flight state and the task context."""
+    async def run():
+        agent = _make_agent(delay=10)
+        task = Task()
+        scheduled = asyncio.create_task(agent.execute_task(task))
+        await asyncio.sleep(0.01)
+        assert agent.is_running and agent.current_task is task
+
+        scheduled.cancel()
+        try:
+            await scheduled
+        except asyncio.CancelledError:
+            pass
+        assert not agent.is_running
+        assert agent.current_task is None
+        assert agent.get_status()['in_flight_tasks'] == []
+
+    asyncio.run(run())
+
+def test_in_flight_tracking():
+    """is_running, current_task and in_flight_tasks follow the executing tasks."""
+    async def run():
+        agent = _make_agent(delay=0.05)
+        assert not agent.is_running and agent.current_task is None
+
+        first, second = Task(task_id='first'), Task(task_id='second')
+        scheduled = [asyncio.create_task(agent.execute_task(task)) for task in (first, second)]
+        await asyncio.sleep(0.01)
+
+        status = agent.get_status()
+        assert agent.is_running and status['is_running']
+        assert status['in_flight_tasks'] == ['first', 'second']
+        assert agent.current_task is second and status['current_task'] == 'second'
+
+        await asyncio.gather(*scheduled)
+        status = agent.get_status()
+        assert not agent.is_running and status['in_flight_tasks'] == []
+        assert agent.current_task is None and status['current_task'] is None
+
+    asyncio.run(run())
+
+def test_current_task_context():
+    """Inside process() current_task is the task of that execution, not the latest one."""
+    seen = []
+
+    class ContextAgent(EchoAgent):
+        async def process(self, task: Task) -> Result:
+            await asyncio.sleep(0.01)
+            seen.append((task.task_id, current_task_var.get().task_id, self.current_task.task_id))
+            return await super().process(task)
+
+    async def run():
+        agent = ContextAgent()
+        agent.initialize()
+        await asyncio.gather(*(agent.execute_task(Task(task_id=str(i))) for i in range(3)))
+        assert current_task_var.get() is None
+
+    asyncio.run(run())
+    assert sorted(seen) == [('0', '0', '0'), ('1', '1', '1'), ('2', '2', '2')]
+
+def test_same_task_executed_concurrently():
+    """Concurrent runs of one Task object each keep their own in-flight entry."""
+    async def run():
+        agent = _make_agent(delay=0.05)
+        task = Task()
+        short_run = asyncio.create_task(agent.execute_task(task))
+        await asyncio.sleep(0.01)
+        agent.delay = 0.2
+        long_run = asyncio.create_task(agent.execute_task(task))
+        await asyncio.sleep(0.01)
+        assert len(agent.get_status()['in_flight_tasks']) == 2
+
+        await short_run
+        assert agent.is_running and agent.current_task is task
+        await long_run
+        assert not agent.is_running
+
+    asyncio.run(run())
+
+def test_datetime_and_stats_compatibility():
+    """Datetime timestamps and dict-style stats from before the monotonic clock still work."""
+    async def run():
+        moment = datetime(2024, 1, 2, 3, 4, 5)
+        task = Task(created_at=moment)
+        assert task.created_at == moment and task.started_at is None
+        task.completed_at = moment
+        assert task.completed_at == moment
+        assert Result(task_id='r', success=True, created_at=moment).created_at == moment
+
+        agent = _make_agent()
+        await agent.execute_task(Task())
+        assert agent.stats['total_tasks'] == agent.stats.total_tasks == 1
+        assert isinstance(agent.stats['last_activity'], datetime)
+        assert dict(agent.stats)['average_execution_time'] == agent.stats.average_execution_time
+
+    asyncio.run(run())
+
+def test_task_queue_priority_order():
+    """Higher priorities come out first, FIFO within a priority."""
+    queue = TaskQueue(max_concurrent_tasks=10)
+    for task_id, priority in [('low', TaskPriority.LOW), ('medium-1', TaskPriority.MEDIUM),
+                              ('critical', TaskPriority.CRITICAL), ('medium-2', TaskPriority.MEDIUM),
+                              ('high', TaskPriority.HIGH)]:
+        assert queue.add_task(Task(task_id=task_id, priority=priority))
+
+    assert queue.get_queue_status()['next_task_priority'] == 'CRITICAL'
+    order = [queue.get_next_task().task_id for _ in range(5)]
+    assert order == ['critical', 'high', 'medium-1', 'medium-2', 'low']
+    assert queue.get_next_task() is None
+
+def test_task_queue_respects_concurrency_limit():
+    """get_next_task() holds tasks back while every slot is busy."""
+    queue = TaskQueue(max_concurrent_tasks=1)
+    queue.add_task(Task(task_id='a'))
+    queue.add_task(Task(task_id='b'))
+
+    assert queue.get_next_task().task_id == 'a'
+    assert queue.get_next_task() is None
+    queue.complete_task('a', Result(task_id='a', success=True))
+    assert queue.get_next_task().task_id == 'b'
+
+def test_task_queue_run_dispatches_to_agents():
+    """run(until_empty=True) executes every queued task on its agent and returns."""
+    async def run():
+        registry = AgentRegistry()
+        registry.register(_make_agent())
+        queue = TaskQueue(max_concurrent_tasks=2)
+        for i in range(5):
+            queue.add_task(Task(task_id=str(i), agent_name='echo'))
+        queue.add_task(Task(task_id='orphan', agent_name='missing'))
+
+        await queue.run(registry, until_empty=True)
+
+        status = queue.get_queue_status()
+        assert status['pending_tasks'] == 0 and status['running_tasks'] == 0
+        assert status['completed_tasks'] == 6
+        assert all(queue._completed_tasks[str(i)].success for i in range(5))
+        assert queue._completed_tasks['orphan'].error == 'Agent missing not found'
+
+    asyncio.run(run())
+
+def test_task_queue_run_starts_tasks_eagerly(monkeypatch):
+    """Queue workers dispatch each task through create_eager_task()."""
+    from src.agents import base_agent
+
+    started = []
+
+    def recording_eager_task(coro):
+        started.append(coro)
+        return create_eager_task(coro)
+
+    monkeypatch.setattr(base_agent, 'create_eager_task', recording_eager_task)
+
+    async def run():
+        registry = AgentRegistry()
+        registry.register(_make_agent())
+        queue = TaskQueue(max_concurrent_tasks=2)
+        for i in range(3):
+            queue.add_task(Task(task_id=str(i), agent_name='echo'))
+
+        await queue.run(registry, until_empty=True)
+        assert len(started) == 3
+        assert all(queue._completed_tasks[str(i)].success for i in range(3))
+
+    asyncio.run(run())
+
+def test_task_queue_run_cancelled_mid_task():
+    """Cancelling run() records the in-flight task as cancelled and frees its slot."""
+    async def run():
+        registry = AgentRegistry()
+        registry.register(_make_agent(delay=10))
+        queue = TaskQueue(max_concurrent_tasks=1)
+        task = Task(task_id='slow', agent_name='echo')
+        queue.add_task(task)
+
+        runner = asyncio.create_task(queue.run(registry))
+        await asyncio.sleep(0.05)
+        runner.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await runner
+
+        status = queue.get_queue_status()
+        assert status['running_tasks'] == 0 and status['completed_tasks'] == 1
+        assert queue._completed_tasks['slow'].error == 'Task cancelled'
+        assert task.status == TaskStatus.CANCELLED
+        assert queue._wakeup is None
+
+        queue.add_task(Task(task_id='next', agent_name='echo'))
+        assert queue.get_next_task().task_id == 'next'
+
+    asyncio.run(run())
+
+def test_batch_process_agent():
+    """Concurrent execute_task() calls are grouped into process_batch() calls."""
+    batch_sizes = []
+
+    class UpperAgent(BatchProcessAgent):
+        async def process_batch(self, tasks):
+            batch_sizes.append(len(tasks))
+            if any(task.parameters.get('fail') for task in tasks):
+                raise ValueError('bad batch')
+            return [Result(task_id=task.task_id, success=True, data=task.task_id.upper()) for task in tasks]
+
+    async def run():
+        agent = UpperAgent('upper', max_batch_size=4, max_wait_ms=10)
+        agent.initialize()
+        try:
+            results = await asyncio.gather(*(agent.execute_task(Task(task_id=f't{i}')) for i in range(10)))
+            assert [result.data for result in results] == [f'T{i}' for i in range(10)]
+            assert batch_sizes == [4, 4, 2]
+            assert agent.get_status()['performance_stats']['total_tasks'] == 10
+
+            failed = await agent.execute_task(Task(parameters={'fail': True}))
+            assert not failed.success and 'bad batch' in failed.error
+            assert not agent.is_running
+        finally:
+            await agent.close()
+
+    asyncio.run(run())
+
+def test_agent_status_cache_invalidation():
+    """get_status() is cached until the agent's state changes."""
+    async def run():
+        agent = EchoAgent()
+
+        status = agent.get_status()
+        assert agent.get_status() is status and not status['is_initialized']
+        agent.initialize()
+        assert agent.get_status()['is_initialized']
+
+        status = agent.get_status()
+        await agent.execute_task(Task())
+        assert agent.get_status() is not status
+        assert agent.get_status()['performance_stats']['total_tasks'] == 1
+
+        agent.reset_stats()
+        assert agent.get_status()['performance_stats']['total_tasks'] == 0
+
+    asyncio.run(run())
+
+def test_registry_status_cache_invalidation():
+    """The cached registry status refreshes when agent state or membership changes."""
+    async def run():
+        agent = EchoAgent()
+        registry = AgentRegistry()
+        registry.register(agent)
+
+        status = agent.get_status()
+        assert agent.get_status() is status and not status['is_initialized']
+        agent.initialize()
+        assert agent.get_status()['is_initialized']
+
+        aggregate = registry.get_agent_status()
+        assert registry.get_agent_status() is aggregate
+        await agent.execute_task(Task())
+        aggregate = registry.get_agent_status()
+        assert aggregate['agents']['echo']['performance_stats']['total_tasks'] == 1
+        assert registry.get_agent_status() is aggregate
+
+        agent.reset_stats()
+        assert registry.get_agent_status()['agents']['echo']['performance_stats']['total_tasks'] == 0
+
+        registry.register(_make_agent(name='second'))
+        assert registry.get_agent_status()['total_agents'] == 2
+        registry.unregister('second')
+        assert registry.get_agent_status()['total_agents'] == 1
+
+        assert registry.get_agent_status('missing') == {'error': 'Agent missing not found'}
+
+    asyncio.run(run())
+
+def test_agent_status_not_cached_for_custom_get_status():
+    """Agents overriding get_status() are queried on every registry status call."""
+    class CustomStatusAgent(EchoAgent):
+        calls = 0
+
+        def get_status(self):
+            CustomStatusAgent.calls += 1
+            return {'calls': CustomStatusAgent.calls}
+
+    registry = AgentRegistry()
+    registry.register(CustomStatusAgent('custom'))
+    first = registry.get_agent_status()['agents']['custom']['calls']
+    second = registry.get_agent_status()['agents']['custom']['calls']
+    assert second == first + 1
+
+def test_batch_process_agent_close_cancels_unfinished_tasks():
+    """close() cancels the callers of the running batch and of tasks still queued."""
+    class SlowAgent(BatchProcessAgent):
+        async def process_batch(self, tasks):
+            await asyncio.sleep(10)
+
+    async def run():
+        agent = SlowAgent('slow', max_batch_size=2, max_wait_ms=1)
+        agent.initialize()
+        tasks = [Task() for _ in range(4)]
+        callers = [asyncio.create_task(agent.execute_task(task)) for task in tasks]
+        await asyncio.sleep(0.05)
+        assert agent.is_running
+
+        await agent.close()
+        outcomes = await asyncio.wait_for(asyncio.gather(*callers, return_exceptions=True), timeout=1)
+        assert all(isinstance(outcome, asyncio.CancelledError) for outcome in outcomes)
+        assert all(task.status == TaskStatus.CANCELLED for task in tasks)
+        assert not agent.is_running
+
+    asyncio.run(run())
+
+def test_batch_process_agent_batcher_failure_fails_callers():
+    """An error escaping the batcher is raised in every waiting caller instead of hanging them."""
+    class BrokenAgent(BatchProcessAgent):
+        async def process_batch(self, tasks):
+            return [None] * len(tasks)
+
+    async def run():
+        agent = BrokenAgent('broken', max_batch_size=2, max_wait_ms=1)
+        agent.initialize()
+        try:
+            outcomes = await asyncio.wait_for(
+                asyncio.gather(*(agent.execute_task(Task()) for _ in range(3)), return_exceptions=True),
+                timeout=1
+            )
+            assert all(isinstance(outcome, AttributeError) for outcome in outcomes)
+        finally:
+            await agent.close()
+
+    asyncio.run(run())
+
+def test_cpu_pool_shutdown():
+    """The shared process pool is released by reset_agent_registry() and recreated on demand."""
+    async def run():
+        agent = _make_agent()
+        assert await agent._run_cpu(pow, 2, 10) == 1024
+        pool = BaseAgent._cpu_pool
+        assert pool is not None
+
+        reset_agent_registry()
+        assert BaseAgent._cpu_pool is None
+        assert await agent._run_cpu(pow, 3, 2) == 9
+        assert BaseAgent._cpu_pool is not pool
+        BaseAgent.shutdown_cpu_pool()
+
+    asyncio.run(run())
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Tests for the ISP pipeline classifier and validator in scripts/run_isp_nc.py.
+
+Classification must match a plain substring scan of the keyword table with
+either term matcher, quality scores must follow the documented weights, and
+the Yellow Pages page cache stays opt-in and never stores empty parses.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+import run_isp_nc  # noqa: E402
+from run_isp_nc import ISPClassifier, ISPDataValidator, ISPScraper  # noqa: E402
+
+RECORDS = [
+    {'business_name': 'Spectrum Internet', 'business_description': 'Cable internet and broadband provider'},
+    {'business_name': 'Foo Fiber Telecom', 'business_description': 'Fiber internet service provider'},
+    {'business_name': 'Sky Link', 'business_description': 'Satellite internet', 'service_type': 'Satellite'},
+    {'business_name': 'Rural DSL Co', 'business_description': 'digital subscriber line service'},
+    {'business_name': 'AirWave', 'business_description': 'Fixed wireless internet over radio'},
+    {'business_name': 'Acme Bakery', 'business_description': 'Fresh bread daily'},
+    {'business_name': 'No Description Networks'},
+    {'business_name': 'Cable Internet Service Provider', 'business_description': 'telecommunications'},
+    {'business_name': 'Coast', 'business_description': 'radio', 'service_type': 'fibre'},
+]
+
+@pytest.fixture(params=['automaton', 'regex'])
+def classifier(request, monkeypatch):
+    """ISP classifier using either term matcher."""
+    if request.param == 'regex':
+        monkeypatch.setattr(run_isp_nc, 'AHOCORASICK_AVAILABLE', False)
+    elif not run_isp_nc.AHOCORASICK_AVAILABLE:
+        pytest.skip('pyahocorasick not installed')
+    return ISPClassifier()
+
+def _reference_classification(classifier, record):
+    """Score a record with one substring test per term, as the keyword table is documented."""
+    text = f"{record.get('business_name', '')} {record.get('business_description', '')}".lower()
+    type_text = f"{text} {record.get('service_type', '')}".lower()
+
+    isp_type = next(
+        (isp_type for isp_type, terms in classifier.ISP_TYPE_TERMS if any(term in type_text for term in terms)),
+        'Mixed/Other'
+    )
+    score = sum(weight for keyword, weight in classifier._keyword_weights.items() if keyword in text)
+    score += 15 if any(term in text for term in classifier.TELECOM_TERMS) else 0
+    score += 10 if any(term in text for term in classifier.SERVICE_TERMS) else 0
+    return isp_type, min(score, 100)
+
+def test_classify_batch_matches_substring_scan(classifier):
+    """classify_batch() and classify() agree with a per-term substring scan for every row."""
+    batch = classifier.classify_batch(pd.DataFrame(RECORDS, index=range(100, 100 + len(RECORDS))))
+    assert list(batch.index) == list(range(100, 100 + len(RECORDS)))
+
+    for record, (_, row) in zip(RECORDS, batch.iterrows()):
+        expected = _reference_classification(classifier, record)
+        assert (row['isp_type'], row['confidence_score']) == expected, record
+        assert classifier.classify(record) == row.to_dict()
+
+@pytest.mark.parametrize('record, isp_type, confidence', [
+    (RECORDS[0], 'Cable', 60),
+    (RECORDS[1], 'Fiber', 95),
+    (RECORDS[5], 'Mixed/Other', 0),
+])
+def test_classify_batch_scores(classifier, record, isp_type, confidence):
+    row = classifier.classify_batch(pd.DataFrame([record])).iloc[0]
+    assert row['isp_type'] == isp_type
+    assert row['confidence_score'] == confidence
+
+def test_validate_batch():
+    """Quality scores follow SCORE_WEIGHTS and flags name each missing or invalid field."""
+    df = pd.DataFrame([
+        {
+            'business_name': 'Spectrum', 'address': '1 Main St, Raleigh, NC',
+            'phone_number': '(919) 555-1234', 'website': 'https://spectrum.com',
+            'business_description': 'Cable internet', 'service_type': 'Cable', 'coverage': 'Wake County'
+        },
+        {
+            'business_name': 'Sky Link', 'address': None,
+            'phone_number': '555-12', 'website': 'not a url',
+            'business_description': '', 'service_type': 'Satellite', 'coverage': None
+        },
+        {
+            'business_name': None, 'address': None, 'phone_number': None, 'website': None,
+            'business_description': None, 'service_type': None, 'coverage': None
+        },
+    ], index=[10, 20, 30])
+
+    result = ISPDataValidator().validate_batch(df)
+
+    assert list(result.index) == [10, 20, 30]
+    assert result['quality_score'].tolist() == [1.1, 0.65, 0.0]
+    assert result['phone_valid'].tolist() == [True, False, False]
+    assert result['website_valid'].tolist() == [True, False, False]
+    assert result['validation_flags'].tolist() == [
+        [],
+        ['missing_address', 'invalid_phone_format', 'invalid_website_format', 'missing_description'],
+        ['missing_business_name', 'missing_address', 'missing_phone', 'missing_website', 'missing_description'],
+    ]
+
+    validator = ISPDataValidator()
+    for (_, row), record in zip(result.iterrows(), df.to_dict('records')):
+        assert validator.validate(record) == row.to_dict()
+
+
+def test_yp_page_cache(tmp_path, monkeypatch):
+    """The page cache is off by default and only keeps pages that parsed to listings."""
+    monkeypatch.delenv(run_isp_nc.YP_CACHE_DIR_ENV, raising=False)
+    assert ISPScraper().cache_dir is None
+
+    monkeypatch.setenv(run_isp_nc.YP_CACHE_DIR_ENV, str(tmp_path))
+    scraper = ISPScraper()
+    assert scraper.cache_dir == tmp_path
+
+    pages = {'https://yp.test/captcha': [], 'https://yp.test/ok': [{'business_name': 'Spectrum'}]}
+
+    async def fetch(url):
+        return '<html></html>'
+
+    monkeypatch.setattr(scraper, '_fetch', fetch)
+    monkeypatch.setattr(scraper, '_parse_yp_listings', lambda html: pages[current])
+
+    for current in pages:
+        assert asyncio.run(scraper._fetch_yp_listings(current)) == pages[current]
+
+    assert scraper._read_page_cache('https://yp.test/captcha') is None
+    assert scraper._read_page_cache('https://yp.test/ok') == [{'business_name': 'Spectrum'}]
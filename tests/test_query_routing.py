@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Tests for routing search queries to the ISP lead pipeline.
+
+Both the Aho-Corasick matcher and the _ISP_QUERY_RE fallback must agree on
+whole-word keyword matches, including plural forms.
+"""
+
+import pytest
+
+import main
+from main import EnhancedCRMApp
+
+ISP_QUERIES = [
+    'ISP', 'ISPs in Raleigh', 'internet service providers', 'Internet Service Provider near me',
+    'broadband', 'fiber internet', 'wisp operators', 'WISPs', 'telecom companies',
+    'telecommunications', 'internet providers', 'cable internet', 'wireless internet',
+    'broadband, fiber',
+]
+
+OTHER_QUERIES = [
+    'plumbers', 'crisp bakery', 'restaurants in Durham', 'whisper salon',
+    'cable tv', 'fiberglass repair', 'ispy games', 'ispss', 'internet cafe', '',
+]
+
+@pytest.fixture(params=['automaton', 'regex'])
+def app(request, monkeypatch):
+    """Query router using either matcher; no scrapers or sessions are needed."""
+    if request.param == 'regex':
+        monkeypatch.setattr(main, '_ISP_QUERY_AUTOMATON', None)
+    elif main._ISP_QUERY_AUTOMATON is None:
+        pytest.skip('pyahocorasick not installed')
+    return EnhancedCRMApp.__new__(EnhancedCRMApp)
+
+@pytest.mark.parametrize('query', ISP_QUERIES)
+def test_isp_queries_are_routed(app, query):
+    assert app._is_isp_related_query(query)
+
+@pytest.mark.parametrize('query', OTHER_QUERIES)
+def test_other_queries_are_not_routed(app, query):
+    assert not app._is_isp_related_query(query)
+
+def test_automaton_matches_regex():
+    """The automaton and the regex fallback route every query the same way."""
+    if main._ISP_QUERY_AUTOMATON is None:
+        pytest.skip('pyahocorasick not installed')
+    app = EnhancedCRMApp.__new__(EnhancedCRMApp)
+    suffixes = ['', 's', 'ss', 'x', '-co', ' ']
+    queries = [
+        f'{prefix}{keyword}{suffix}'
+        for keyword in main.ISP_QUERY_KEYWORDS
+        for prefix in ('', 'a', 'local ', '-')
+        for suffix in suffixes
+    ]
+    for query in queries:
+        assert app._is_isp_related_query(query) == bool(main._ISP_QUERY_RE.search(query)), query
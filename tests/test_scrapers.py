@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Tests for shared scraper behaviour.
+"""
+
+import threading
+import time
+
+from src.scrapers.base_scraper import BaseScraper
+
+class _NullScraper(BaseScraper):
+    """Scraper with no sources, used to exercise the base class."""
+
+    def scrape(self, query, location=None, **kwargs):
+        return []
+
+def test_rate_limit_is_thread_safe():
+    """Concurrent callers sharing one scraper are still spaced rate_limit_delay apart."""
+    scraper = _NullScraper(rate_limit_delay=0.05)
+    request_times = []
+    times_lock = threading.Lock()
+
+    def request():
+        scraper._rate_limit()
+        with times_lock:
+            request_times.append(time.time())
+
+    threads = [threading.Thread(target=request) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    request_times.sort()
+    gaps = [later - earlier for earlier, later in zip(request_times, request_times[1:])]
+    assert len(request_times) == 6
+    assert min(gaps) >= 0.04